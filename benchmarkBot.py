@@ -0,0 +1,106 @@
+import os
+import sys
+import json
+import tempfile
+import argparse
+
+# Benchmark runs get their own data dir so they never touch handshake_data/
+if not os.environ.get("HANDSHAKE_DATA_DIR"):
+    os.environ["HANDSHAKE_DATA_DIR"] = tempfile.mkdtemp(prefix="handshake_bench_")
+
+import seleniumBot as bot
+import fixtureServer
+
+# --- CONFIGURATION ---
+DEFAULT_MAX_REGRESSION = 0.15   # Allowed relative slowdown before the gate fails
+
+# Metrics compared against a baseline: name -> True if higher is better
+GATED_METRICS = {
+    'jobs_per_min': True,
+    'p50_job_s': False,
+    'p95_job_s': False,
+    'commands_per_job': False,
+}
+
+# --- STATS ---
+
+def summarize(stats):
+    jobs = stats['jobs']
+    minutes = max(stats['elapsed_s'], 1e-9) / 60
+    return {
+        'jobs': jobs,
+        'applied': stats['applied'],
+        'statuses': stats['statuses'],
+        'elapsed_s': round(stats['elapsed_s'], 2),
+        'jobs_per_min': round(jobs / minutes, 2),
+        'p50_job_s': round(bot.percentile(stats['job_durations'], 50), 3),
+        'p95_job_s': round(bot.percentile(stats['job_durations'], 95), 3),
+        'commands': stats['commands'],
+        'commands_per_job': round(stats['commands'] / jobs, 1) if jobs else 0.0,
+    }
+
+def check_regression(result, baseline, max_regression):
+    """
+    Returns a list of human-readable failures (empty if within tolerance).
+    """
+    failures = []
+    for name, higher_is_better in GATED_METRICS.items():
+        old, new = baseline.get(name), result.get(name)
+        if not old or new is None: continue
+        change = (new - old) / old
+        regressed = change < -max_regression if higher_is_better else change > max_regression
+        if regressed:
+            failures.append(f"{name}: {old} -> {new} ({change:+.0%})")
+    return failures
+
+# --- RUN ---
+
+def run_benchmark(args):
+    server = fixtureServer.start_fixture_server(
+        port=0, pages=args.pages, cards=args.cards, latency_ms=args.latency_ms,
+        server_latency_ms=args.server_latency_ms, variants=args.variants)
+    if args.pipeline:
+        bot.PIPELINE_MODE = True
+
+    profile_dir = tempfile.mkdtemp(prefix="handshake_bench_profile_")
+    print(f"[BENCH] Fixture: {server.base_url} | data: {bot.DATA_DIR}")
+    try:
+        stats = bot.run_bot(profile_dir=profile_dir, interactive=False,
+                            start_url=f"{server.base_url}/job-search", headless=not args.headed)
+    finally:
+        server.shutdown()
+    return summarize(stats)
+
+def print_report(result):
+    print("\n--- BENCHMARK ---")
+    print(f"Jobs: {result['jobs']} in {result['elapsed_s']}s -> {result['jobs_per_min']} jobs/min")
+    print(f"Per-job latency: p50 {result['p50_job_s']}s | p95 {result['p95_job_s']}s")
+    print(f"WebDriver commands: {result['commands']} ({result['commands_per_job']} per job)")
+    print(f"Statuses: {result['statuses']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline throughput benchmark against fixtureServer.py (headless Chrome)")
+    fixtureServer.add_fixture_arguments(parser)
+    parser.add_argument("--pipeline", action="store_true", help="Benchmark PIPELINE_MODE")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    parser.add_argument("--output", metavar="JSON", help="Write the result to this file")
+    parser.add_argument("--baseline", metavar="JSON", help="Fail if the result regresses against this result file")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="Allowed relative regression per gated metric (default 0.15)")
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+    print_report(result)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        failures = check_regression(result, baseline, args.max_regression)
+        if failures:
+            print("\n[REGRESSION] " + "\n[REGRESSION] ".join(failures))
+            sys.exit(1)
+        print("\n[OK] Within regression budget.")
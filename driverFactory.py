@@ -0,0 +1,161 @@
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import subprocess
+import urllib.request
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+# --- CONFIGURATION ---
+CACHE_FILE = os.environ.get("HANDSHAKE_DRIVER_CACHE") or os.path.join(
+    os.path.expanduser("~"), ".cache", "handshake_bot", "chromedriver.json")
+DEBUG_HOST = "127.0.0.1"
+DEBUGGER_START_TIMEOUT = 15     # Seconds to wait for a detached Chrome to open its debugging port
+
+CHROME_PATHS = {
+    "darwin": ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"],
+    "win32": [os.path.join(os.environ.get(var, ""), "Google", "Chrome", "Application", "chrome.exe")
+              for var in ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA")],
+}
+CHROME_COMMANDS = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+# --- CHROME DISCOVERY ---
+
+def chrome_binary():
+    for path in CHROME_PATHS.get(sys.platform, []):
+        if os.path.exists(path): return path
+    for name in CHROME_COMMANDS:
+        path = shutil.which(name)
+        if path: return path
+    return None
+
+def chrome_version():
+    """
+    Installed Chrome version without starting a browser: Info.plist on macOS,
+    the registry on Windows, `--version` elsewhere. None if Chrome is not found.
+    """
+    try:
+        if sys.platform == "darwin":
+            import plistlib
+            with open("/Applications/Google Chrome.app/Contents/Info.plist", "rb") as f:
+                return plistlib.load(f)["CFBundleShortVersionString"]
+        if sys.platform == "win32":
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0]
+    except (OSError, KeyError): pass
+
+    binary = chrome_binary()
+    if not binary: return None
+    try:
+        out = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"\d+(\.\d+)+", out)
+    return match.group(0) if match else None
+
+# --- CHROMEDRIVER CACHE ---
+
+def load_cache():
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache):
+    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+    tmp = CACHE_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp, CACHE_FILE)
+
+def resolve_chromedriver():
+    """
+    Path to a chromedriver matching the installed Chrome. Cached per Chrome
+    version, so webdriver_manager (network) only runs after a Chrome update.
+    Returns None when nothing resolves; Selenium then looks for one itself.
+    """
+    version = chrome_version()
+    cache = load_cache()
+    cached = cache.get(version) if version else None
+    if cached and os.path.exists(cached):
+        return cached
+
+    path = None
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+    except Exception as e:
+        print(f"[DRIVER] webdriver_manager failed ({str(e)[:60]}). Trying PATH.")
+        path = shutil.which("chromedriver")
+
+    if path and version:
+        cache[version] = path
+        try: save_cache(cache)
+        except OSError: pass
+    return path
+
+def chrome_service():
+    path = resolve_chromedriver()
+    return Service(path) if path else Service()
+
+# --- REMOTE DEBUGGING ---
+
+def debugger_alive(port):
+    try:
+        with urllib.request.urlopen(f"http://{DEBUG_HOST}:{port}/json/version", timeout=0.5) as resp:
+            return resp.status == 200
+    except OSError:
+        return False
+
+def launch_detached_chrome(options, port):
+    """
+    Starts Chrome with `options`' command-line flags and a debugging port, in its
+    own session so it outlives this script. Experimental options (prefs) are not
+    applied. Returns False if Chrome could not be started.
+    """
+    binary = chrome_binary()
+    if not binary: return False
+    args = [a if a.startswith("--") else "--" + a for a in options.arguments]
+    subprocess.Popen([binary, f"--remote-debugging-port={port}", *args],
+                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+    deadline = time.time() + DEBUGGER_START_TIMEOUT
+    while time.time() < deadline:
+        if debugger_alive(port): return True
+        time.sleep(0.2)
+    return False
+
+def attach_options(options, port):
+    attach = Options()
+    attach.debugger_address = f"{DEBUG_HOST}:{port}"
+    attach.page_load_strategy = options.page_load_strategy
+    logging_prefs = options.to_capabilities().get("goog:loggingPrefs")
+    if logging_prefs:
+        attach.set_capability("goog:loggingPrefs", logging_prefs)
+    perf_prefs = options.experimental_options.get("perfLoggingPrefs")
+    if perf_prefs:
+        attach.add_experimental_option("perfLoggingPrefs", perf_prefs)
+    return attach
+
+# --- ENTRY POINT ---
+
+def create_driver(options, debug_port=None):
+    """
+    Returns a Chrome WebDriver for `options`.
+
+    With debug_port, attaches to the Chrome listening on that port, starting a
+    detached one first if none is. The browser then survives the script, and the
+    next run attaches in well under a second instead of relaunching.
+    """
+    if debug_port:
+        if debugger_alive(debug_port) or launch_detached_chrome(options, debug_port):
+            print(f"[DRIVER] Attaching to Chrome on port {debug_port}")
+            return webdriver.Chrome(service=chrome_service(), options=attach_options(options, debug_port))
+        print(f"[DRIVER] Could not start Chrome on port {debug_port}. Launching normally.")
+    return webdriver.Chrome(service=chrome_service(), options=options)
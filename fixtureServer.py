@@ -0,0 +1,398 @@
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from html import escape
+
+import snapshotStore
+
+# --- CONFIGURATION ---
+DEFAULT_PORT = 8765
+DEFAULT_PAGES = 4
+DEFAULT_CARDS = 25
+DEFAULT_LATENCY_MS = 150        # Client-side delay for pane / modal / submit transitions
+DEFAULT_SERVER_LATENCY_MS = 50  # Delay before every HTTP response
+
+# Modal variants, cycled over the jobs in order:
+#   resume          - resume selector only (applies cleanly)
+#   cover_letter    - cover letter required
+#   transcript      - transcript required
+#   other_docs      - other required documents
+#   questions_text  - free-text question
+#   questions_radio - radio question
+#   external        - 'Apply externally' button
+#   applied         - already applied
+DEFAULT_VARIANTS = ["resume", "cover_letter", "resume", "external", "questions_text", "resume", "transcript", "applied"]
+
+COMPANIES = ["NeuralSeek", "Acme Robotics", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries", "Wayne Enterprises"]
+TITLES = ["Software Engineering Intern", "Machine Learning Intern", "Data Science Intern",
+          "Backend Developer Intern", "Research Assistant", "Product Analyst Intern"]
+LOCATIONS = ["Remote", "New York, NY", "San Francisco, CA", "Austin, TX", "Seattle, WA"]
+PAYS = ["$36–45/hr", "$11–20K/mo", "$25/hr", "$30–40/hr", ""]
+JOB_TYPES = ["Internship", "Full-Time", "Part-Time"]
+
+# --- SYNTHETIC DATA ---
+
+def build_jobs(pages, cards, variants, seed=7):
+    rng = random.Random(seed)
+    now = datetime.now()
+    jobs = []
+    for i in range(pages * cards):
+        job_id = str(90000000 + i)
+        variant = variants[i % len(variants)]
+        jobs.append({
+            'id': job_id,
+            'title': f"{rng.choice(TITLES)} {i}",
+            'employer': {'name': rng.choice(COMPANIES)},
+            'location': rng.choice(LOCATIONS),
+            'remote': False,
+            'pay': {'text': rng.choice(PAYS)},
+            'job_type': {'name': rng.choice(JOB_TYPES)},
+            'created_at': (now - timedelta(days=rng.randint(0, 30))).isoformat(timespec='seconds'),
+            'description': "Build things with a small team. Python experience is a plus.",
+            'variant': variant,
+            'applied': variant == "applied",
+        })
+        jobs[-1]['remote'] = jobs[-1]['location'] == "Remote"
+    return jobs
+
+# --- PAGE ---
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Job Search (fixture)</title>
+<style>
+  body { font-family: sans-serif; margin: 0; display: flex; }
+  #list { width: 40%; height: 100vh; overflow-y: auto; }
+  .card { border-bottom: 1px solid #ddd; padding: 8px; cursor: pointer; }
+  [data-hook='right-content'] { width: 60%; padding: 16px; min-height: 200px; }
+  #modal-root { position: fixed; inset: 0; background: rgba(0,0,0,.3); }
+  .modal { background: white; margin: 60px auto; width: 480px; padding: 16px;
+           transform: translateY(40px); transition: transform .2s ease-out; }
+  .modal.open { transform: translateY(0); }
+  [role='option'] { padding: 4px; border: 1px solid #ccc; cursor: pointer; }
+</style>
+</head>
+<body>
+<div id="list"></div>
+<div data-hook="right-content"></div>
+<nav style="position: fixed; bottom: 0; left: 0;">
+  <button aria-label="next page" __NEXT_DISABLED__>Next</button>
+</nav>
+<script>
+const PAGE = __PAGE__, PAGES = __PAGES__, LATENCY = __LATENCY__;
+const list = document.getElementById('list');
+const pane = document.querySelector("[data-hook='right-content']");
+const esc = s => String(s == null ? '' : s).replace(/[&<>"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c]));
+const later = fn => setTimeout(fn, LATENCY);
+
+function jobIdFromPath() {
+  let m = location.pathname.match(/\\/job-search\\/(\\w+)/);
+  return m ? m[1] : null;
+}
+
+function renderCards(jobs) {
+  list.innerHTML = jobs.map(j => `
+    <div data-hook="job-result-card | ${j.id}" class="card">
+      <a href="/job-search/${j.id}?page=${PAGE}" aria-label="View ${esc(j.title)}">${esc(j.title)}</a>
+      <img alt="${esc(j.employer.name)}" width="16" height="16" src="data:image/gif;base64,R0lGODlhAQABAAAAACw=">
+      <div>${esc(j.employer.name)}</div>
+      <div>${esc(j.pay.text)}</div>
+      <div>${esc(j.location)}</div>
+    </div>`).join('');
+  list.querySelectorAll('.card').forEach(card => card.addEventListener('click', e => {
+    e.preventDefault();
+    showJob(card.getAttribute('data-hook').split('|')[1].trim(), true);
+  }));
+}
+
+async function showJob(id, push) {
+  pane.innerHTML = '';
+  if (push) history.pushState({}, '', `/job-search/${id}?page=${PAGE}`);
+  let job = await (await fetch('/api/jobs/' + id)).json();
+  later(() => renderPane(job));
+}
+
+function renderPane(job) {
+  let action;
+  if (job.applied) action = '<p>Applied</p><button>Withdraw application</button>';
+  else if (job.variant === 'external') action = '<button>Apply externally</button>';
+  else action = '<button id="apply-btn">Apply</button>';
+  pane.innerHTML = `
+    <div data-job-id="${job.id}">
+      <h2>${esc(job.title)}</h2>
+      <div>${esc(job.employer.name)}</div>
+      <div>${esc(job.pay.text)}∙${esc(job.job_type.name)}</div>
+      <div>${esc(job.location)}</div>
+      ${action}
+      <p>${esc(job.description)}</p>
+    </div>`;
+  let btn = document.getElementById('apply-btn');
+  if (btn) btn.addEventListener('click', () => later(() => openModal(job)));
+}
+
+const EXTRA_FIELDS = {
+  cover_letter: '<label>Cover letter</label><input placeholder="Search your cover letters">',
+  transcript: '<label>Transcript</label><input placeholder="Search your transcripts">',
+  other_docs: '<p>Other required documents</p><input placeholder="Search your documents">',
+  questions_text: '<label>Why are you interested?</label><textarea aria-label="Why are you interested?"></textarea>',
+  questions_radio: '<p>Are you authorized to work?</p><label><input type="radio" name="q1"> Yes</label><label><input type="radio" name="q1"> No</label>'
+};
+
+function closeModal() {
+  let root = document.getElementById('modal-root');
+  if (root) root.remove();
+}
+
+function openModal(job) {
+  closeModal();
+  let root = document.createElement('div');
+  root.id = 'modal-root';
+  root.setAttribute('role', 'dialog');
+  root.innerHTML = `
+    <div data-hook="apply-modal-content" class="modal">
+      <button aria-label="Close">&times;</button>
+      <h3>Apply to ${esc(job.employer.name)}</h3>
+      <label>Resume</label>
+      <input id="resume" placeholder="Search your resumes" value="">
+      <div id="resume-options"></div>
+      ${EXTRA_FIELDS[job.variant] || ''}
+      <div id="status"></div>
+      <button id="submit-btn">Submit Application</button>
+    </div>`;
+  document.body.appendChild(root);
+  let modal = root.firstElementChild;
+  requestAnimationFrame(() => requestAnimationFrame(() => modal.classList.add('open')));
+
+  root.querySelector("[aria-label='Close']").addEventListener('click', closeModal);
+  let resume = root.querySelector('#resume');
+  resume.addEventListener('click', () => later(() => {
+    let options = root.querySelector('#resume-options');
+    options.innerHTML = '<div role="option">Resume.pdf</div>';
+    options.firstElementChild.addEventListener('click', () => { resume.value = 'Resume.pdf'; options.innerHTML = ''; });
+  }));
+  root.querySelector('#submit-btn').addEventListener('click', () => {
+    if (!resume.value) { root.querySelector('#status').innerHTML = '<div role="alert">A resume is required.</div>'; return; }
+    root.querySelector('#status').innerHTML = '<div role="progressbar">Submitting</div>';
+    later(async () => {
+      await fetch('/api/apply/' + job.id, {method: 'POST'});
+      closeModal();
+      renderPane(Object.assign({}, job, {applied: true}));
+    });
+  });
+}
+
+document.addEventListener('keydown', e => { if (e.key === 'Escape') closeModal(); });
+document.querySelector("[aria-label='next page']").addEventListener('click', () => {
+  location.href = `/job-search?page=${PAGE + 1}`;
+});
+
+(async () => {
+  let data = await (await fetch('/api/jobs?page=' + PAGE)).json();
+  renderCards(data.jobs);
+  let id = jobIdFromPath() || (data.jobs[0] && data.jobs[0].id);
+  if (id) showJob(id, false);
+})();
+</script>
+</body>
+</html>
+"""
+
+def render_page(page, pages, latency_ms):
+    return (PAGE_TEMPLATE
+            .replace("__PAGE__", str(page))
+            .replace("__PAGES__", str(pages))
+            .replace("__LATENCY__", str(latency_ms))
+            .replace("__NEXT_DISABLED__", "disabled" if page >= pages else ""))
+
+# --- SNAPSHOTS ---
+
+SNAPSHOT_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Snapshot __JOB__</title></head>
+<body>
+__LIST__
+__PANE__
+__MODAL__
+</body>
+</html>
+"""
+
+def render_snapshot_index(store):
+    job = lambda e: f"<a href='/snapshots/job/{escape(e['job_id'])}'>{escape(e['job_id'])}</a>" if e['job_id'] else ""
+    rows = [f"<tr><td>{escape(e['time'])}</td><td>{job(e)}</td>"
+            f"<td>{escape(e['status'])}</td><td><a href='/snapshots/{e['hash']}'>{escape(e['part'])}</a></td></tr>"
+            for e in reversed(list(store.entries()))]
+    return ("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Snapshots</title></head><body>"
+            "<table><tr><th>Time</th><th>Job ID</th><th>Status</th><th>Part</th></tr>"
+            + "".join(rows) + "</table></body></html>")
+
+def render_job_snapshot(store, job_id):
+    """
+    The newest list, pane and modal captured for job_id in one document, so the
+    bot's selectors (CARD_SCAN_JS, pane_verdict, analyze_modal) run against it.
+    """
+    parts = store.latest(job_id)
+    if not parts: return None
+    if 'page' in parts and len(parts) == 1: return store.get(parts['page'])
+    html = SNAPSHOT_PAGE_TEMPLATE.replace("__JOB__", escape(job_id))
+    for part in ("list", "pane", "modal"):
+        html = html.replace(f"__{part.upper()}__", (store.get(parts[part]) if part in parts else None) or "")
+    return html
+
+# --- SERVER ---
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+      GET  /job-search[/<id>]?page=N  - search page (cards + right pane)
+      GET  /api/jobs?page=N           - JSON page of jobs (what the page itself fetches)
+      GET  /api/jobs/<id>             - JSON job detail
+      POST /api/apply/<id>            - mark a job applied
+      GET  /snapshots                 - recorded DOM snapshots (with --snapshots)
+      GET  /snapshots/<hash>          - one stored part as captured
+      GET  /snapshots/job/<id>        - newest list + pane + modal of a job as one page
+    """
+    def log_message(self, format, *args):
+        pass # Keep benchmark output clean
+
+    def _delay(self):
+        time.sleep(self.server.server_latency_ms / 1000)
+
+    def _send(self, status, body, content_type):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, payload, status=200):
+        self._send(status, json.dumps(payload), "application/json")
+
+    def _page_number(self, query):
+        try: page = int(parse_qs(query).get('page', ['1'])[0])
+        except ValueError: page = 1
+        return min(max(page, 1), self.server.pages)
+
+    def _job(self, job_id):
+        job = self.server.jobs_by_id.get(job_id)
+        if job is None: return None
+        return dict(job, applied=job['applied'] or job_id in self.server.applied)
+
+    def do_GET(self):
+        self._delay()
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip('/')
+
+        if path == "/job-search" or re.fullmatch(r"/job-search/\w+", path):
+            page = self._page_number(parts.query)
+            return self._send(200, render_page(page, self.server.pages, self.server.latency_ms), "text/html; charset=utf-8")
+
+        if path == "/api/jobs":
+            page = self._page_number(parts.query)
+            cards = self.server.cards
+            jobs = [self._job(j['id']) for j in self.server.jobs[(page - 1) * cards: page * cards]]
+            return self._send_json({'page': page, 'pages': self.server.pages, 'jobs': jobs})
+
+        match = re.fullmatch(r"/api/jobs/(\w+)", path)
+        if match:
+            job = self._job(match.group(1))
+            return self._send_json(job) if job else self._send_json({'error': 'not found'}, 404)
+
+        if path.startswith("/snapshots") and self.server.snapshots:
+            return self._send_snapshot(path)
+
+        self._send(404, "Not found", "text/plain")
+
+    def _send_snapshot(self, path):
+        store = self.server.snapshots
+        html = None
+        if path == "/snapshots":
+            html = render_snapshot_index(store)
+        elif re.fullmatch(r"/snapshots/job/\w+", path):
+            html = render_job_snapshot(store, path.rsplit("/", 1)[1])
+        elif re.fullmatch(r"/snapshots/[0-9a-f]+", path):
+            html = store.get(path.rsplit("/", 1)[1])
+        if html is None:
+            return self._send(404, "Not found", "text/plain")
+        self._send(200, html, "text/html; charset=utf-8")
+
+    def do_POST(self):
+        self._delay()
+        match = re.fullmatch(r"/api/apply/(\w+)", urlsplit(self.path).path)
+        if not match or match.group(1) not in self.server.jobs_by_id:
+            return self._send_json({'error': 'not found'}, 404)
+        with self.server.lock:
+            self.server.applied.add(match.group(1))
+        self._send_json({'ok': True})
+
+def create_fixture_server(host="127.0.0.1", port=DEFAULT_PORT, pages=DEFAULT_PAGES, cards=DEFAULT_CARDS,
+                          latency_ms=DEFAULT_LATENCY_MS, server_latency_ms=DEFAULT_SERVER_LATENCY_MS,
+                          variants=None, snapshots=None):
+    server = ThreadingHTTPServer((host, port), FixtureHandler)
+    server.daemon_threads = True
+    server.pages = pages
+    server.cards = cards
+    server.latency_ms = latency_ms
+    server.server_latency_ms = server_latency_ms
+    server.jobs = build_jobs(pages, cards, variants or DEFAULT_VARIANTS)
+    server.jobs_by_id = {j['id']: j for j in server.jobs}
+    server.applied = set()
+    server.lock = threading.Lock()
+    server.snapshots = snapshotStore.SnapshotStore(snapshots) if snapshots else None
+    server.base_url = f"http://{host}:{server.server_address[1]}"
+    return server
+
+def start_fixture_server(**kwargs):
+    """
+    Starts the fixture server on a daemon thread. Use port=0 for a free port.
+    Returns the server; its search page is server.base_url + '/job-search'.
+    """
+    server = create_fixture_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def parse_variants(value):
+    variants = [v.strip() for v in value.split(",") if v.strip()]
+    unknown = set(variants) - {"resume", "cover_letter", "transcript", "other_docs",
+                               "questions_text", "questions_radio", "external", "applied"}
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown variants: {', '.join(sorted(unknown))}")
+    return variants
+
+def add_fixture_arguments(parser):
+    parser.add_argument("--pages", type=int, default=DEFAULT_PAGES, help="Result pages")
+    parser.add_argument("--cards", type=int, default=DEFAULT_CARDS, help="Cards per page")
+    parser.add_argument("--latency-ms", type=int, default=DEFAULT_LATENCY_MS, help="UI transition latency")
+    parser.add_argument("--server-latency-ms", type=int, default=DEFAULT_SERVER_LATENCY_MS, help="HTTP response latency")
+    parser.add_argument("--variants", type=parse_variants, default=DEFAULT_VARIANTS,
+                        help="Comma-separated modal variants cycled over the jobs")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline Handshake stand-in for benchmarks and selector checks")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    add_fixture_arguments(parser)
+    parser.add_argument("--snapshots", metavar="DIR", help="Also serve the DOM snapshots recorded in DIR (e.g. handshake_data/snapshots)")
+    args = parser.parse_args()
+
+    server = create_fixture_server(port=args.port, pages=args.pages, cards=args.cards, latency_ms=args.latency_ms,
+                                   server_latency_ms=args.server_latency_ms, variants=args.variants,
+                                   snapshots=args.snapshots)
+    print(f"Fixture job search at {server.base_url}/job-search ({args.pages} pages x {args.cards} cards)")
+    if server.snapshots:
+        print(f"Recorded snapshots at {server.base_url}/snapshots")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[STOP] Fixture server stopped.")
+        sys.exit(0)
@@ -0,0 +1,253 @@
+import os
+import json
+import argparse
+from collections import Counter, defaultdict
+from datetime import datetime
+
+import seleniumBot as bot
+
+# --- CONFIGURATION ---
+CACHE_FILE = os.path.join(bot.DATA_DIR, "analytics_cache.json")
+CACHE_VERSION = 1
+
+# Barrier flags parsed out of 'Requirements' (one bit each in the cache)
+BARRIER_FLAGS = [
+    "Cover Letter", "Transcript", "Other Docs",
+    "Questions (Checkbox/Radio)", "Questions (Text)", "Document Selector",
+]
+HOURS_PER_MONTH = 2080 / 12
+
+# --- PARSING ---
+
+def barrier_mask(requirements):
+    """
+    Bitmask of BARRIER_FLAGS in a Requirements string, or None when the text
+    is not a barrier list (e.g. 'Validation Error', 'Resume Only').
+    """
+    mask = 0
+    for part in requirements.split(","):
+        part = part.strip()
+        if not part: continue
+        name = "Document Selector" if part.startswith("Document Selector") else part
+        if name not in BARRIER_FLAGS: return None
+        mask |= 1 << BARRIER_FLAGS.index(name)
+    return mask or None
+
+def barrier_names(mask):
+    return [name for i, name in enumerate(BARRIER_FLAGS) if mask >> i & 1]
+
+def row_timestamp(text):
+    try: return int(datetime.strptime(text, bot.DATE_FORMAT).timestamp())
+    except ValueError: return None
+
+# --- COLUMNAR CACHE ---
+
+class LogColumns:
+    """
+    Every logged row as parallel columns. Strings with few distinct values
+    (status, company, requirement notes) are dictionary-encoded; Requirements
+    become a barrier bitmask and Pay an hourly (low, high) range. Saved as JSON
+    together with the byte offset reached in each log, so a refresh only
+    parses rows appended since the last run.
+    """
+    COLUMNS = ['job_id', 'ts', 'status', 'company', 'barriers', 'predicted', 'note', 'pay_low', 'pay_high']
+    CODED = ['status', 'company', 'note']
+
+    def __init__(self):
+        self.offsets = {}
+        self.cols = {name: [] for name in self.COLUMNS}
+        self.dicts = {name: [] for name in self.CODED}
+        self._codes = {name: {} for name in self.CODED}
+
+    @classmethod
+    def load(cls, path):
+        columns = cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return columns
+        if saved.get('version') != CACHE_VERSION: return columns
+        columns.offsets = saved['offsets']
+        columns.cols = saved['columns']
+        columns.dicts = saved['dicts']
+        columns._codes = {name: {v: i for i, v in enumerate(values)} for name, values in columns.dicts.items()}
+        return columns
+
+    def save(self, path):
+        tmp = path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'offsets': self.offsets,
+                       'columns': self.cols, 'dicts': self.dicts}, f, separators=(',', ':'))
+        os.replace(tmp, path)
+
+    def __len__(self):
+        return len(self.cols['job_id'])
+
+    def code(self, column, value):
+        codes = self._codes[column]
+        if value not in codes:
+            codes[value] = len(self.dicts[column])
+            self.dicts[column].append(value)
+        return codes[value]
+
+    def value(self, column, i):
+        return self.dicts[column][self.cols[column][i]]
+
+    def append(self, row):
+        requirements = row['Requirements']
+        predicted = requirements.startswith(bot.PREDICTED_PREFIX)
+        if predicted: requirements = requirements[len(bot.PREDICTED_PREFIX):]
+        mask = barrier_mask(requirements)
+        pay = bot.parse_pay(row['Pay'])
+        self.cols['job_id'].append(row['Job ID'])
+        self.cols['ts'].append(row_timestamp(row['Date']))
+        self.cols['status'].append(self.code('status', row['Status']))
+        self.cols['company'].append(self.code('company', row['Company']))
+        self.cols['barriers'].append(mask or 0)
+        self.cols['predicted'].append(int(predicted))
+        self.cols['note'].append(self.code('note', "" if mask else requirements))
+        self.cols['pay_low'].append(round(pay[0], 2) if pay else None)
+        self.cols['pay_high'].append(round(pay[1], 2) if pay else None)
+
+    def refresh(self, filepaths):
+        """
+        Reads what was appended to each log since the cached offsets. A log that
+        shrank or disappeared was rewritten, so the cache is rebuilt from scratch.
+        Returns the number of new rows.
+        """
+        names = {os.path.basename(p) for p in filepaths}
+        stale = any(name not in names for name in self.offsets) or any(
+            self.offsets.get(os.path.basename(p), 0) > os.path.getsize(p) for p in filepaths)
+        if stale:
+            self.__init__()
+        added = 0
+        for path in filepaths:
+            name = os.path.basename(path)
+            progress = {'offset': self.offsets.get(name, 0)}
+            try:
+                for row in bot.read_log_rows(path, progress['offset'], progress):
+                    self.append(row)
+                    added += 1
+            except OSError as e:
+                print(f"[ERROR] Read {name}: {e}")
+                continue
+            self.offsets[name] = progress['offset']
+        return added
+
+def load_columns(filepaths, cache_path=CACHE_FILE, use_cache=True):
+    columns = LogColumns.load(cache_path) if use_cache else LogColumns()
+    added = columns.refresh(filepaths)
+    if use_cache and (added or not os.path.exists(cache_path)):
+        try: columns.save(cache_path)
+        except OSError as e: print(f"[ERROR] Cache not saved: {e}")
+    return columns, added
+
+# --- REPORTS ---
+
+def select(columns, since=None, status=None):
+    """Row indices matching the filters."""
+    rows = range(len(columns))
+    if since:
+        cutoff = since.timestamp()
+        rows = [i for i in rows if columns.cols['ts'][i] and columns.cols['ts'][i] >= cutoff]
+    if status:
+        rows = [i for i in rows if columns.value('status', i) == status]
+    return list(rows)
+
+def median(values):
+    if not values: return None
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    return ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+def pay_summary(columns, rows):
+    lows = [columns.cols['pay_low'][i] for i in rows if columns.cols['pay_low'][i] is not None]
+    highs = [columns.cols['pay_high'][i] for i in rows if columns.cols['pay_high'][i] is not None]
+    if not lows: return "no pay listed"
+    low, high = median(lows), median(highs)
+    return (f"median ${low:.2f}–{high:.2f}/hr (${low * HOURS_PER_MONTH:,.0f}–{high * HOURS_PER_MONTH:,.0f}/mo), "
+            f"{len(lows)} with pay")
+
+def status_report(columns, rows):
+    print("\n--- STATUS ---")
+    counts = Counter(columns.value('status', i) for i in rows)
+    for status, count in counts.most_common():
+        matching = [i for i in rows if columns.value('status', i) == status]
+        print(f"{status:<12} {count:>6}  {count / len(rows):6.1%}  {pay_summary(columns, matching)}")
+    notes = Counter(columns.value('note', i) for i in rows
+                    if columns.value('status', i) == 'Failed' and columns.value('note', i))
+    if notes:
+        print("Failed because: " + ", ".join(f"{note} ({count})" for note, count in notes.most_common(5)))
+
+def barrier_report(columns, rows):
+    print("\n--- BARRIERS ---")
+    saved = [i for i in rows if columns.cols['barriers'][i]]
+    if not saved:
+        print("No barriers logged.")
+        return
+    predicted = sum(columns.cols['predicted'][i] for i in saved)
+    print(f"{len(saved)} jobs with barriers ({predicted} predicted without opening the modal)")
+    flags = Counter(name for i in saved for name in barrier_names(columns.cols['barriers'][i]))
+    for name, count in flags.most_common():
+        print(f"{name:<28} {count:>6}  {count / len(saved):6.1%} of barrier jobs")
+    combos = Counter(columns.cols['barriers'][i] for i in saved)
+    print("Most common combinations:")
+    for mask, count in combos.most_common(5):
+        print(f"  {count:>5}  {' + '.join(barrier_names(mask))}")
+
+def company_report(columns, rows, top):
+    print(f"\n--- TOP {top} COMPANIES ---")
+    by_company = defaultdict(Counter)
+    for i in rows:
+        by_company[columns.value('company', i)][columns.value('status', i)] += 1
+    ranked = sorted(by_company.items(), key=lambda item: -sum(item[1].values()))
+    for company, statuses in ranked[:top]:
+        total = sum(statuses.values())
+        detail = ", ".join(f"{s} {c}" for s, c in statuses.most_common(3))
+        print(f"{(company or '(none)')[:40]:<40} {total:>5}  {detail}")
+
+def throughput_report(columns, rows, bucket):
+    print(f"\n--- THROUGHPUT (per {bucket}) ---")
+    fmt = "%Y-%m-%d %H:00" if bucket == "hour" else "%Y-%m-%d"
+    jobs, applied = Counter(), Counter()
+    for i in rows:
+        ts = columns.cols['ts'][i]
+        if ts is None: continue
+        key = datetime.fromtimestamp(ts).strftime(fmt)
+        jobs[key] += 1
+        if columns.value('status', i) == 'APPLIED': applied[key] += 1
+    if not jobs:
+        print("No dated rows.")
+        return
+    for key in sorted(jobs):
+        print(f"{key:<16} {jobs[key]:>5} jobs  {applied[key]:>4} applied")
+    print(f"Mean: {sum(jobs.values()) / len(jobs):.1f} jobs, {sum(applied.values()) / len(jobs):.1f} applied per active {bucket}")
+
+REPORTS = ['status', 'barriers', 'companies', 'throughput']
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reports over every application log in handshake_data/")
+    parser.add_argument("reports", nargs="*", metavar="REPORT",
+                        help=f"Reports to print: {', '.join(REPORTS)} (default: all)")
+    parser.add_argument("--since", type=datetime.fromisoformat, metavar="DATE",
+                        help="Only rows logged at or after DATE (e.g. 2025-12-27 or '2025-12-27 09:00')")
+    parser.add_argument("--status", help="Only rows with this Status (e.g. APPLIED)")
+    parser.add_argument("--top", type=int, default=15, help="Companies to list")
+    parser.add_argument("--by", choices=["hour", "day"], default="day", help="Throughput bucket")
+    parser.add_argument("--no-cache", action="store_true", help="Parse every log from scratch; leave the cache alone")
+    args = parser.parse_args()
+    unknown = set(args.reports) - set(REPORTS)
+    if unknown: parser.error(f"unknown report: {', '.join(sorted(unknown))}")
+
+    columns, added = load_columns(bot.discover_csv_logs(), use_cache=not args.no_cache)
+    rows = select(columns, args.since, args.status)
+    print(f"[DATA] {len(columns)} rows ({added} new since the cached summary), {len(rows)} selected.")
+    if not rows:
+        raise SystemExit(0)
+
+    reports = args.reports or REPORTS
+    if 'status' in reports: status_report(columns, rows)
+    if 'barriers' in reports: barrier_report(columns, rows)
+    if 'companies' in reports: company_report(columns, rows, args.top)
+    if 'throughput' in reports: throughput_report(columns, rows, args.by)
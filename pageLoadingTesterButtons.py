@@ -1,20 +1,21 @@
 import os
 import time
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 
+import driverFactory
+
 # --- CONFIGURATION ---
 BASE_DIR = os.path.expanduser("~/Desktop/handshake_bot") 
 CHROME_PROFILE = os.path.join(BASE_DIR, "chrome_profile")
+DEBUG_PORT = 9222  # Reuse one Chrome across runs instead of relaunching it
 DEBUG_FILE = os.path.join(BASE_DIR, "handshake_source.html")
 
 # --- SETUP BROWSER ---
 options = Options()
 options.add_argument(f"user-data-dir={CHROME_PROFILE}") 
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = driverFactory.create_driver(options, DEBUG_PORT)
 
 try:
     driver.get("https://app.joinhandshake.com/job-search")
@@ -1,52 +1,51 @@
 import os
 import time
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+
+import driverFactory
+import seleniumBot as bot
+import snapshotStore
 
 # --- CONFIGURATION ---
 BASE_DIR = os.path.expanduser("~/Desktop/handshake_bot") 
 CHROME_PROFILE = os.path.join(BASE_DIR, "chrome_profile")
-DUMP_FILE = os.path.join(BASE_DIR, "full_page_dump.html")
+DEBUG_PORT = 9222  # Reuse one Chrome across runs instead of relaunching it
+CAPTURE_EVERY = 5  # Seconds between captures; unchanged pages are deduplicated by the store
 
 # --- SETUP BROWSER ---
 options = Options()
 options.add_argument(f"user-data-dir={CHROME_PROFILE}") 
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = driverFactory.create_driver(options, DEBUG_PORT)
 
 try:
     driver.get("https://app.joinhandshake.com/job-search")
+    store = snapshotStore.SnapshotStore(bot.SNAPSHOT_DIR, bot.SNAPSHOT_MAX_MB)
     
-    print("\n--- FULL HTML DUMP ---")
+    print("\n--- PAGE RECORDER ---")
     print("1. Log in if needed.")
-    print("2. Navigate to the job search page.")
-    print("3. Scroll down a little to ensure job cards are loaded.")
-    input("4. Press ENTER here to dump the HTML...")
-
-    # Get the full HTML
-    full_html = driver.page_source
-
-    # Print to terminal
-    print("\n" + "="*50)
-    print("BEGIN HTML OUTPUT")
-    print("="*50 + "\n")
-    
-    print(full_html)
-    
-    print("\n" + "="*50)
-    print("END HTML OUTPUT")
-    print("="*50 + "\n")
-
-    # Also save to file for safety
-    with open(DUMP_FILE, "w", encoding="utf-8") as f:
-        f.write(full_html)
-    
-    print(f"✅ The HTML has also been saved to: {DUMP_FILE}")
+    print("2. Browse the job search: open jobs, open an Apply modal, page through results.")
+    print(f"3. The page is captured every {CAPTURE_EVERY}s. Press Ctrl+C to stop.")
+    print(f"   Replay: python fixtureServer.py --snapshots {bot.SNAPSHOT_DIR}")
+
+    seen = set()
+    while True:
+        time.sleep(CAPTURE_EVERY)
+        try:
+            digest = bot.save_page_snapshot(driver, store, "manual")
+        except Exception as e:
+            print(f"Capture failed: {e}")
+            continue
+        if digest not in seen:
+            seen.add(digest)
+            print(f"Captured {driver.current_url} -> {digest}")
+
+except KeyboardInterrupt:
+    print(f"\n✅ Snapshots saved to: {bot.SNAPSHOT_DIR}")
 
 except Exception as e:
     print(f"Error: {e}")
 
 finally:
     # driver.quit() # Keep browser open
-    pass
\ No newline at end of file
+    pass
@@ -1,19 +1,22 @@
 import os
 import time
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 
+import driverFactory
+import seleniumBot as bot
+import snapshotStore
+
 # --- CONFIGURATION ---
 BASE_DIR = os.path.expanduser("~/Desktop/handshake_bot") 
 CHROME_PROFILE = os.path.join(BASE_DIR, "chrome_profile")
+DEBUG_PORT = 9222  # Reuse one Chrome across runs instead of relaunching it
 
 # --- SETUP BROWSER ---
 options = Options()
 options.add_argument(f"user-data-dir={CHROME_PROFILE}") 
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = driverFactory.create_driver(options, DEBUG_PORT)
 
 try:
     driver.get("https://app.joinhandshake.com/job-search")
@@ -79,6 +82,12 @@ try:
     except Exception as e:
         print(f"Error checking buttons: {e}")
 
+    # Keep what was inspected, so the same DOM can be replayed offline later
+    store = snapshotStore.SnapshotStore(bot.SNAPSHOT_DIR, bot.SNAPSHOT_MAX_MB)
+    digest = bot.save_page_snapshot(driver, store, "inspector")
+    print(f"\n📦 Page snapshot {digest} saved to {bot.SNAPSHOT_DIR}")
+    print(f"   Replay: python fixtureServer.py --snapshots {bot.SNAPSHOT_DIR}")
+
 except Exception as e:
     print(f"Critical Error: {e}")
 
@@ -1,11 +1,31 @@
 import time
+import math
+import re
 import random
 import csv
 import os
 import sys
+import io
+import glob
+import sqlite3
+import json
+import zlib
+import base64
+import shutil
+import signal
+import tempfile
+import threading
+import subprocess
+import argparse
+import functools
+import heapq
+from array import array
+from bisect import bisect_left
+from collections import deque, Counter, defaultdict
+from contextlib import contextmanager
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from datetime import datetime, timedelta
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -19,11 +39,18 @@ from selenium.common.exceptions import (
     ElementClickInterceptedException,
     WebDriverException
 )
-from webdriver_manager.chrome import ChromeDriverManager
+
+import driverFactory
+import snapshotStore
+
+try:
+    import psutil # Optional: process-tree lookups without shelling out to `ps`
+except ImportError:
+    psutil = None
 
 # --- CONFIGURATION ---
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-DATA_DIR = os.path.join(PROJECT_ROOT, "handshake_data")
+DATA_DIR = os.environ.get("HANDSHAKE_DATA_DIR") or os.path.join(PROJECT_ROOT, "handshake_data")
 
 if not os.path.exists(DATA_DIR):
     os.makedirs(DATA_DIR)
@@ -31,8 +58,123 @@ if not os.path.exists(DATA_DIR):
 DEFAULT_CSV_NAME = "application_log.csv"
 CHROME_PROFILE = os.path.join(DATA_DIR, "chrome_profile")
 
+# LOG WRITER
+LOG_FLUSH_ROWS = 10     # Append buffered rows to the CSV after this many rows...
+LOG_FLUSH_SECONDS = 30  # ...or once the oldest buffered row is this old
+
+# SEARCH
+SEARCH_URL = "https://app.joinhandshake.com/job-search"
+RESUME_SEARCH = True    # Reopen the last filtered search at its first unfinished page
+CURSOR_FILE = os.path.join(DATA_DIR, "search_cursor.json")
+
+# JOB OPENING
+JOB_OPEN_MODE = "hook"  # "hook": click the card found by its data-hook, "url": open the job page by URL
+
+# PIPELINE
+PIPELINE_MODE = False       # Page ahead in a background tab while applying in the main tab
+PREFETCH_QUEUE_SIZE = 50    # Max jobs buffered ahead of the apply loop
+PREFETCH_PAGE_TIMEOUT = 15  # Give up paging if the next page never renders
+
+# BROWSER
+DEBUG_PORT = None       # e.g. 9222: attach to (or start) a Chrome on this port that outlives the bot
+
+# FAST LOAD
+FAST_LOAD = True        # Headless once the profile is logged in, heavy resources blocked, no smooth scrolling
+BLOCKED_URL_PATTERNS = [
+    # Images, media and fonts (the bot only reads the logo's alt text)
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico",
+    "*.mp4", "*.webm", "*.mp3", "*.woff", "*.woff2", "*.ttf", "*.otf",
+    # Analytics and tracking
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*segment.io*", "*segment.com*", "*hotjar.com*", "*fullstory.com*",
+    "*amplitude.com*", "*intercom.io*", "*facebook.net*", "*datadoghq*", "*sentry.io*",
+]
+
+# NETWORK CAPTURE
+CAPTURE_JOB_FEED = True     # Read job data from the search page's JSON responses instead of the DOM
+JOB_FEED_URL_HINTS = ("graphql", "job", "search", "posting")
+SKIP_JOB_TYPES = []         # e.g. ["Full-Time"]: logged as 'Filtered' without opening the job
+
+# FILTERS - matching jobs are logged as 'Filtered' without any click
+EXCLUDE_COMPANIES = []          # Exact company names
+EXCLUDE_TITLE_KEYWORDS = []     # e.g. ["unpaid", "sales", "senior"] (case-insensitive)
+EXCLUDE_LOCATIONS = []          # Substrings of the location, e.g. ["TX"]
+REMOTE_ONLY = False
+MIN_HOURLY_PAY = None           # e.g. 20: drop jobs whose parsed pay tops out below $20/hr (unknown pay passes)
+
+# PLANNER
+PLAN_AHEAD_PAGES = 0        # Scan this many extra result pages into a priority queue, best jobs first (0 = page order)
+SCORE_WEIGHTS = {
+    'pay_per_10_hr': 1.0,       # Per $10/hr of mid-range pay
+    'remote': 2.0,
+    'preferred_location': 2.0,
+    'fresh': 3.0,               # Posted today, fading to 0 after RECENCY_DAYS
+    'barrier_risk': 3.0,        # Subtracted, times the predicted barrier probability
+}
+PREFERRED_LOCATIONS = []        # e.g. ["New York", "Seattle"]
+JOB_TYPE_SCORES = {"Internship": 1.0}
+TITLE_KEYWORD_SCORES = {}       # e.g. {"machine learning": 3, "software": 2, "intern": 1}
+RECENCY_DAYS = 30
+
+# BARRIER PREDICTION
+PREDICT_BARRIERS = True     # Log near-certain barrier jobs as Saved without opening the modal
+BARRIER_THRESHOLD = 0.9     # Predicted barrier probability needed to skip the modal
+BARRIER_MIN_SUPPORT = 5     # ...backed by at least this many logged outcomes
+BARRIER_SPOT_CHECK = 0.1    # Share of predicted skips that open the modal anyway to measure accuracy
+BARRIER_MODEL = os.path.join(DATA_DIR, "barrier_model.json")
+
+# TRACING
+TRACE_ENABLED = True    # Per-stage timings to a JSON-lines trace + end-of-run summary
+TRACE_DIR = os.path.join(DATA_DIR, "traces")
+
+# HISTORY
+HISTORY_BACKEND = "sqlite"  # "sqlite" (indexed DB) or "csv" (merge every CSV log via an ID index)
+HISTORY_DB = os.path.join(DATA_DIR, "application_history.db")
+HISTORY_INDEX = os.path.join(DATA_DIR, "history_ids.bin") # Job ID index for the csv backend (+ .json manifest)
+CLAIM_TTL = 30 * 60     # A worker's claim on a job expires after this (crashed worker)
+
+# SUPERVISOR
+WATCHDOG_TIMEOUT = 120  # Kill and relaunch Chrome when no page or job starts for this long (0 = off)
+PAGE_LOAD_TIMEOUT = 60  # driver.get() ceiling (chromedriver's default is 300s)
+MAX_RESTARTS = 20       # Give up after this many browser relaunches in one run
+MAX_JOB_CRASHES = 2     # Skip a job that was in flight during this many session losses
+RESTART_DELAY = 5       # Pause before relaunching
+
+# MULTI-TAB
+TAB_CONCURRENCY = 1     # Jobs applied to at once, each in its own tab, interleaved (1 = one pane, one job)
+
+# MEMORY
+MEMORY_CHECK_EVERY = 10     # Sample Chrome's memory every N jobs
+MEMORY_CEILING_MB = 2000    # Recycle once the Chrome process tree's summed RSS exceeds this (None = off)
+JS_HEAP_CEILING_MB = 500    # ...or the search tab's JS heap exceeds this (None = off)
+RECYCLE_AFTER_JOBS = 400    # Recycle after this many jobs regardless (None = off)
+RECYCLE_MODE = "tab"        # "tab": reopen the page in a fresh tab, "browser": relaunch Chrome (same profile)
+
+# RETRIES
+RETRY_BUDGET = 3        # Attempts at a transient failure (job/modal did not load, no Submit, unverified) before logging it
+RETRY_BACKOFF = 120     # Seconds before the first retry; doubles with every attempt
+RETRY_FILE = os.path.join(DATA_DIR, "retry_queue.json")
+
+# SNAPSHOTS
+SNAPSHOTS = False           # Record list/pane/modal HTML of sampled and failed jobs (CLI --snapshots)
+SNAPSHOT_DIR = os.path.join(DATA_DIR, "snapshots")
+SNAPSHOT_SAMPLE = 0.02      # Share of jobs kept whatever their outcome
+SNAPSHOT_STATUSES = ['Failed', 'No Button', 'Retry'] # Outcomes always kept ('Retry' = deferred transient failure)
+SNAPSHOT_MAX_MB = 200       # Oldest snapshots are pruned beyond this (None = keep all)
+
 # LIMITS
 DAILY_LIMIT = 200 
+HOURLY_LIMIT = None     # Optional pacing cap per rolling hour (None = off)
+
+# WAITS (seconds) - every wait returns as soon as its DOM condition holds
+WAIT_POLL = 0.1         # How often a condition is re-checked
+PANE_TIMEOUT = 4        # Ceiling for the right pane to show the clicked job
+MODAL_TIMEOUT = 5       # Ceiling for the apply modal to appear and settle
+SUBMIT_TIMEOUT = 8      # Ceiling for the submit outcome (success marker or error banner)
+VERIFY_TIMEOUT = 4      # Ceiling for the success marker to render
+OVERLAY_TIMEOUT = 1     # Ceiling for overlays to disappear after ESC/Close
+SCROLL_TIMEOUT = 1      # Ceiling for scrollIntoView to settle
+PAGE_TIMEOUT = 10       # Ceiling for the next results page to replace the current cards
 
 FIELDNAMES = [
     'Job ID', 'Date', 'Status', 'Requirements', 'Company', 'Title', 
@@ -67,46 +209,826 @@ def init_csv(filepath):
             writer.writeheader()
     return filepath
 
-def load_history(filepath):
-    processed = set()
-    if os.path.exists(filepath):
+def load_history(filepaths, index_path=HISTORY_INDEX):
+    """
+    Job IDs from every log in filepaths, merged into one JobIdSet. A prebuilt
+    ID index remembers how far each log was read, so later startups only parse
+    rows appended since.
+    """
+    ids, offsets = load_id_index(index_path, filepaths)
+    read = 0
+    for path in filepaths:
+        name = os.path.basename(path)
+        progress = {'offset': offsets.get(name, 0)}
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get('Job ID'):
-                        processed.add(row['Job ID'])
-        except Exception: pass
-    return processed
+            for row in read_log_rows(path, progress['offset'], progress):
+                ids.add(row['Job ID'])
+                read += 1
+        except OSError as e:
+            print(f"[ERROR] History read {name}: {e}")
+            continue
+        offsets[name] = progress['offset']
+    if read or not os.path.exists(index_path):
+        save_id_index(index_path, ids, offsets)
+    return ids
 
-def count_applications_last_24h(filepath):
-    if not os.path.exists(filepath): return 0
-    count = 0
-    now = datetime.now()
-    one_day_ago = now - timedelta(hours=24)
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get('Status') == 'APPLIED' and row.get('Date'):
+def applied_times_since(filepaths, cutoff):
+    times = []
+    for path in filepaths:
+        try:
+            for row in read_log_rows(path):
+                if row['Status'] == 'APPLIED' and row['Date']:
                     try:
                         job_date = datetime.strptime(row['Date'], "%Y-%m-%d %H:%M:%S")
-                        if job_date > one_day_ago: count += 1
+                        if job_date > cutoff: times.append(job_date)
                     except ValueError: pass
-    except Exception: pass
-    return count
+        except OSError: pass
+    return times
+
+def count_applications_since(filepaths, cutoff):
+    return len(applied_times_since(filepaths, cutoff))
+
+def count_applications_last_24h(filepaths):
+    return count_applications_since(filepaths, datetime.now() - timedelta(hours=24))
+
+# Header spellings seen in older logs ('job_id', 'JOB ID', ...) map onto FIELDNAMES
+FIELD_ALIASES = {name.lower().replace(' ', ''): name for name in FIELDNAMES}
+
+def canonical_field(header):
+    return FIELD_ALIASES.get((header or '').strip().lower().replace(' ', '').replace('_', ''))
+
+def read_log_rows(path, offset=0, progress=None):
+    """
+    Streams the rows of one CSV log from a byte offset, one line at a time,
+    keyed by FIELDNAMES whatever the file's own header is (renamed, reordered,
+    missing or extra columns are fine). progress['offset'] tracks the end of
+    the last complete row; a torn last line is left for the next read.
+    """
+    with open(path, 'rb') as f:
+        header_line = f.readline()
+        headers = next(csv.reader([header_line.decode('utf-8', errors='replace')]), None)
+        if not headers: return
+        columns = [canonical_field(h) for h in headers]
+        offset = max(offset, len(header_line))
+        f.seek(offset)
+        record = b''
+        for line in f:
+            if not line.endswith(b'\n'): break
+            record += line
+            if record.count(b'"') % 2: continue # Newline inside a quoted field
+            offset += len(record)
+            values = next(csv.reader([record.decode('utf-8', errors='replace')]), [])
+            record = b''
+            if progress is not None: progress['offset'] = offset
+            row = dict.fromkeys(FIELDNAMES, "")
+            for column, value in zip(columns, values):
+                if column: row[column] = value
+            if row['Job ID']: yield row
+
+class JobIdSet:
+    """
+    Compact set of Job IDs. Numeric IDs (practically all of them) live in a
+    sorted array('q') at 8 bytes each and are found by bisection; new ones
+    collect in a small set that merge() folds in. Non-numeric IDs stay in a
+    plain set of strings.
+    """
+    MERGE_AT = 4096
+
+    def __init__(self, ids=(), numeric=None):
+        self.numeric = numeric if numeric is not None else array('q')
+        self.recent = set()
+        self.other = set()
+        for job_id in ids: self.add(job_id)
+        self.merge()
+
+    @staticmethod
+    def _as_int(job_id):
+        text = str(job_id)
+        return int(text) if text.isdigit() and len(text) < 19 else None
+
+    def __contains__(self, job_id):
+        number = self._as_int(job_id)
+        if number is None: return str(job_id) in self.other
+        if number in self.recent: return True
+        i = bisect_left(self.numeric, number)
+        return i < len(self.numeric) and self.numeric[i] == number
+
+    def add(self, job_id):
+        number = self._as_int(job_id)
+        if number is None:
+            self.other.add(str(job_id))
+        elif number not in self:
+            self.recent.add(number)
+            if len(self.recent) >= self.MERGE_AT: self.merge()
 
-def log_to_csv(filepath, data):
+    def merge(self):
+        if not self.recent: return
+        self.numeric = array('q', heapq.merge(self.numeric, sorted(self.recent)))
+        self.recent.clear()
+
+    def __len__(self):
+        return len(self.numeric) + len(self.recent) + len(self.other)
+
+    def __iter__(self):
+        self.merge()
+        for number in self.numeric: yield str(number)
+        yield from self.other
+
+def load_id_index(index_path, filepaths):
+    """
+    Returns (JobIdSet, {log name: offset read}) from the on-disk index, or an
+    empty set when the index is missing, torn, or a log it covers was removed
+    or rewritten (shorter than the offset read).
+    """
+    manifest_path = index_path + ".json"
     try:
-        with open(filepath, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-            clean = {k: (v if v is not None else "") for k, v in data.items()}
-            writer.writerow(clean)
-    except Exception as e:
-        print(f"[ERROR] CSV Write: {e}")
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        sizes = {os.path.basename(p): os.path.getsize(p) for p in filepaths if os.path.exists(p)}
+        offsets = manifest['logs']
+        if any(name not in sizes or sizes[name] < offset for name, offset in offsets.items()):
+            return JobIdSet(), {}
+        numeric = array('q')
+        with open(index_path, 'rb') as f:
+            numeric.fromfile(f, manifest['count'])
+        ids = JobIdSet(numeric=numeric)
+        ids.other.update(manifest.get('other', []))
+        return ids, dict(offsets)
+    except (OSError, ValueError, KeyError, EOFError):
+        return JobIdSet(), {}
+
+def save_id_index(index_path, ids, offsets):
+    ids.merge()
+    try:
+        with open(index_path + ".tmp", 'wb') as f:
+            ids.numeric.tofile(f)
+        manifest = {'count': len(ids.numeric), 'other': sorted(ids.other), 'logs': offsets,
+                    'updated': datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        with open(index_path + ".json.tmp", 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        # Index first: a manifest never describes more IDs than the index holds
+        os.replace(index_path + ".tmp", index_path)
+        os.replace(index_path + ".json.tmp", index_path + ".json")
+    except OSError as e:
+        print(f"[ERROR] History index: {e}")
+
+class ApplicationLogWriter:
+    """
+    Long-lived, buffered writer for the application log CSV.
+    Every row is first appended to a journal next to the CSV, then buffered and
+    written in batches. checkpoint() fsyncs the CSV and resets the journal, so
+    after a crash any journaled row missing from the CSV is replayed on startup.
+    """
+    def __init__(self, filepath, flush_rows=LOG_FLUSH_ROWS, flush_seconds=LOG_FLUSH_SECONDS):
+        self.filepath = filepath
+        self.journal_path = filepath + ".journal"
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.buffer = []
+        self.first_buffered = None
+        self.file = open(filepath, 'a', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=FIELDNAMES)
+        self.journal = open(self.journal_path, 'a+', encoding='utf-8')
+        self.recover()
+
+    def _row_key(self, row):
+        return (row.get('Job ID'), row.get('Date'), row.get('Status'))
+
+    def recover(self):
+        """
+        Replays journaled rows that never reached the CSV. Returns rows restored.
+        """
+        self.journal.seek(0)
+        lines = self.journal.read().splitlines()
+        if not lines:
+            self.checkpoint()
+            return 0
+        try: offset = json.loads(lines[0]).get('checkpoint', 0)
+        except ValueError: offset = 0
+
+        # Rows written after the last checkpoint may or may not be in the CSV
+        written = set()
+        with open(self.filepath, 'rb') as f:
+            f.seek(offset)
+            tail = f.read().decode('utf-8', errors='replace')
+        for row in csv.DictReader(io.StringIO(tail, newline=''), fieldnames=FIELDNAMES):
+            written.add(self._row_key(row))
+
+        missing = []
+        for line in lines[1:]:
+            try: row = json.loads(line)
+            except ValueError: continue # Torn last line
+            if self._row_key(row) not in written: missing.append(row)
+
+        if missing:
+            self.writer.writerows(missing)
+            print(f"[LOG] Recovered {len(missing)} unflushed rows from journal.")
+        self.checkpoint()
+        return len(missing)
+
+    def write(self, data):
+        row = {k: (data.get(k) if data.get(k) is not None else "") for k in FIELDNAMES}
+        try:
+            self.journal.write(json.dumps(row) + "\n")
+            self.journal.flush()
+        except Exception as e:
+            print(f"[ERROR] Journal Write: {e}")
+        self.buffer.append(row)
+        if self.first_buffered is None: self.first_buffered = time.time()
+        if len(self.buffer) >= self.flush_rows or time.time() - self.first_buffered >= self.flush_seconds:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer: return
+        try:
+            self.writer.writerows(self.buffer)
+            self.file.flush()
+            self.buffer = []
+            self.first_buffered = None
+        except Exception as e:
+            print(f"[ERROR] CSV Write: {e}") # Rows stay buffered and journaled
+
+    def checkpoint(self):
+        """
+        Flushes, fsyncs the CSV and starts a fresh journal at the current CSV size.
+        """
+        self.flush()
+        if self.buffer: return # Flush failed, keep the journal
+        try:
+            os.fsync(self.file.fileno())
+            self.journal.seek(0)
+            self.journal.truncate()
+            self.journal.write(json.dumps({'checkpoint': self.file.tell()}) + "\n")
+            self.journal.flush()
+            os.fsync(self.journal.fileno())
+        except Exception as e:
+            print(f"[ERROR] Log Checkpoint: {e}")
+
+    def close(self):
+        self.checkpoint()
+        self.file.close()
+        self.journal.close()
+
+# --- HISTORY STORE ---
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+DB_COLUMNS = [name.lower().replace(' ', '_') for name in FIELDNAMES]
+
+def discover_csv_logs():
+    return sorted(glob.glob(os.path.join(DATA_DIR, "application_log*.csv")))
+
+class CsvHistoryStore:
+    """
+    History read straight from the CSV logs: every application_log*.csv in
+    DATA_DIR, merged, with Job IDs served from the on-disk ID index.
+    """
+    def __init__(self, csv_path):
+        self.csv_path = csv_path
+        self.paths = discover_csv_logs()
+        if csv_path not in self.paths: self.paths.append(csv_path)
+
+    def seen_jobs(self):
+        return load_history(self.paths)
+
+    def count_applied_since(self, cutoff):
+        return count_applications_since(self.paths, cutoff)
+
+    def applied_times_since(self, cutoff):
+        return applied_times_since(self.paths, cutoff)
+
+    def record(self, data):
+        pass # The CSV log itself is the history
+
+    def close(self):
+        pass
+
+class SeenJobs:
+    """
+    Set-like view of processed Job IDs backed by the indexed DB, so startup
+    does not have to load every ID into memory.
+    """
+    def __init__(self, store):
+        self.store = store
+        self.added = set()
+
+    def __contains__(self, job_id):
+        return job_id in self.added or self.store.has_job(job_id)
+
+    def add(self, job_id):
+        self.added.add(job_id)
+
+class SqliteHistoryStore:
+    """
+    Indexed history in SQLite (WAL mode). CSV logs are imported incrementally:
+    each file's imported byte offset is remembered, so only appended rows are read.
+    Safe to share between worker processes: job claims and quota reservations
+    are taken inside IMMEDIATE transactions.
+    """
+    def __init__(self, db_path, worker=None):
+        self.worker = worker
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        columns = ", ".join(f"{c} TEXT" for c in DB_COLUMNS)
+        self.conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS applications (
+                {columns},
+                UNIQUE (job_id, date, status)
+            );
+            CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications (job_id);
+            CREATE INDEX IF NOT EXISTS idx_applications_status_date ON applications (status, date);
+            CREATE TABLE IF NOT EXISTS imported_logs (path TEXT PRIMARY KEY, offset INTEGER);
+            CREATE TABLE IF NOT EXISTS claims (job_id TEXT PRIMARY KEY, worker TEXT, claimed_at REAL);
+            CREATE TABLE IF NOT EXISTS reservations (worker TEXT PRIMARY KEY, reserved_at REAL);
+        """)
+
+    @contextmanager
+    def transaction(self):
+        """
+        IMMEDIATE transaction: takes the write lock up front so check-then-insert
+        sequences are atomic across processes.
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def _insert_sql(self):
+        marks = ", ".join("?" for _ in DB_COLUMNS)
+        return f"INSERT OR IGNORE INTO applications ({', '.join(DB_COLUMNS)}) VALUES ({marks})"
+
+    def import_csv(self, path):
+        """
+        Imports rows appended to a CSV log since the last import. Returns rows read.
+        """
+        size = os.path.getsize(path)
+        row = self.conn.execute("SELECT offset FROM imported_logs WHERE path = ?", (path,)).fetchone()
+        offset = row[0] if row else 0
+        if offset == size: return 0
+        if offset > size: offset = 0 # File was rewritten, start over
+
+        progress = {'offset': offset}
+        count = Counter()
+        def rows():
+            for r in read_log_rows(path, offset, progress):
+                count['rows'] += 1
+                yield tuple(r[name] for name in FIELDNAMES)
+        with self.transaction():
+            self.conn.executemany(self._insert_sql(), rows())
+            self.conn.execute("INSERT OR REPLACE INTO imported_logs (path, offset) VALUES (?, ?)", (path, progress['offset']))
+        return count['rows']
+
+    def import_csv_logs(self, paths):
+        total = 0
+        for path in paths:
+            try: total += self.import_csv(path)
+            except Exception as e: print(f"[ERROR] History import {os.path.basename(path)}: {e}")
+        if total: print(f"[HISTORY] Imported {total} rows from CSV logs.")
+        return total
+
+    def export_csv(self, path):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDNAMES)
+            writer.writerows(self.conn.execute(
+                f"SELECT {', '.join(DB_COLUMNS)} FROM applications ORDER BY date, rowid"))
+
+    def has_job(self, job_id):
+        return self.conn.execute(
+            "SELECT 1 FROM applications WHERE job_id = ? LIMIT 1", (job_id,)).fetchone() is not None
+
+    def seen_jobs(self):
+        return SeenJobs(self)
+
+    def count_applied_since(self, cutoff):
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM applications WHERE status = 'APPLIED' AND date > ?",
+            (cutoff.strftime(DATE_FORMAT),)).fetchone()[0]
+
+    def applied_times_since(self, cutoff):
+        rows = self.conn.execute(
+            "SELECT date FROM applications WHERE status = 'APPLIED' AND date > ? ORDER BY date",
+            (cutoff.strftime(DATE_FORMAT),))
+        times = []
+        for (date,) in rows:
+            try: times.append(datetime.strptime(date, DATE_FORMAT))
+            except ValueError: pass
+        return times
+
+    def claim(self, job_id, worker):
+        """
+        Claims a job for one worker. False if it is already done or another
+        worker holds a live claim on it.
+        """
+        now = time.time()
+        with self.transaction():
+            if self.has_job(job_id): return False
+            self.conn.execute("""
+                INSERT INTO claims (job_id, worker, claimed_at) VALUES (?, ?, ?)
+                ON CONFLICT (job_id) DO UPDATE SET worker = excluded.worker, claimed_at = excluded.claimed_at
+                WHERE claims.claimed_at < ?
+            """, (job_id, worker, now, now - CLAIM_TTL))
+            owner = self.conn.execute("SELECT worker FROM claims WHERE job_id = ?", (job_id,)).fetchone()
+        return owner is not None and owner[0] == worker
+
+    def reserve_slot(self, limit, window_hours=24):
+        """
+        Reserves one application slot for self.worker under a quota shared by all
+        workers: APPLIED rows in the window plus live reservations must stay below limit.
+        """
+        now = time.time()
+        cutoff = (datetime.now() - timedelta(hours=window_hours)).strftime(DATE_FORMAT)
+        with self.transaction():
+            if self.conn.execute("SELECT 1 FROM reservations WHERE worker = ?", (self.worker,)).fetchone():
+                return True
+            applied = self.conn.execute(
+                "SELECT COUNT(*) FROM applications WHERE status = 'APPLIED' AND date > ?", (cutoff,)).fetchone()[0]
+            reserved = self.conn.execute(
+                "SELECT COUNT(*) FROM reservations WHERE reserved_at > ?", (now - CLAIM_TTL,)).fetchone()[0]
+            if applied + reserved >= limit: return False
+            self.conn.execute("INSERT OR REPLACE INTO reservations (worker, reserved_at) VALUES (?, ?)", (self.worker, now))
+        return True
+
+    def record(self, data):
+        try:
+            with self.transaction():
+                self.conn.execute(self._insert_sql(), tuple(data.get(name) or "" for name in FIELDNAMES))
+                if data.get('Status') == 'APPLIED' and self.worker:
+                    # The slot is now counted through the APPLIED row
+                    self.conn.execute("DELETE FROM reservations WHERE worker = ?", (self.worker,))
+        except sqlite3.Error as e:
+            print(f"[ERROR] History DB Write: {e}")
+
+    def close(self):
+        self.conn.close()
+
+def open_history_store(csv_path, worker=None):
+    if HISTORY_BACKEND == "sqlite" or worker:
+        # Workers always coordinate through the shared DB
+        store = SqliteHistoryStore(HISTORY_DB, worker=worker.name if worker else None)
+        store.import_csv_logs(discover_csv_logs())
+        return store
+    return CsvHistoryStore(csv_path)
+
+# --- RATE LIMITER ---
+
+class RateLimiter:
+    """
+    Sliding-window quota: a daily limit per rolling 24h plus an optional per-hour
+    pacing cap. Each window is a deque of timestamps; expired entries are popped
+    from the left, so checks and records are amortised O(1).
+    """
+    def __init__(self, daily_limit, hourly_limit=None, history=()):
+        self.windows = [(daily_limit, 24 * 3600, deque())]
+        if hourly_limit:
+            self.windows.append((hourly_limit, 3600, deque()))
+        for dt in sorted(history):
+            self.record(dt.timestamp())
+
+    def _expire(self, now):
+        for _, span, stamps in self.windows:
+            while stamps and stamps[0] <= now - span:
+                stamps.popleft()
+
+    def used(self, now=None):
+        self._expire(now or time.time())
+        return len(self.windows[0][2])
+
+    def wait_time(self, now=None):
+        """
+        Seconds until the next application is allowed (0 if allowed now).
+        """
+        now = now or time.time()
+        self._expire(now)
+        wait = 0
+        for limit, span, stamps in self.windows:
+            if len(stamps) >= limit:
+                # The slot frees up when the entry 'limit' places from the end expires
+                wait = max(wait, stamps[len(stamps) - limit] + span - now)
+        return wait
+
+    def can_apply(self, now=None):
+        return self.wait_time(now) <= 0
+
+    def headroom(self, now=None):
+        """
+        Applications that may still be submitted right now.
+        """
+        self._expire(now or time.time())
+        return max(0, min(limit - len(stamps) for limit, _, stamps in self.windows))
+
+    def record(self, now=None):
+        now = now or time.time()
+        for _, _, stamps in self.windows:
+            stamps.append(now)
+
+class SharedRateLimiter:
+    """
+    Quota shared by every worker process through the history DB. A worker holds
+    at most one reserved slot at a time; it is consumed when an APPLIED row is
+    recorded. Optional hourly pacing stays local to the worker.
+    """
+    def __init__(self, store, daily_limit, hourly_limit=None):
+        self.store = store
+        self.daily_limit = daily_limit
+        self.local = RateLimiter(float('inf'), hourly_limit)
+
+    def used(self, now=None):
+        return self.store.count_applied_since(datetime.now() - timedelta(hours=24))
+
+    def wait_time(self, now=None):
+        wait = self.local.wait_time(now)
+        if wait > 0: return wait
+        if self.store.reserve_slot(self.daily_limit): return 0
+        times = self.store.applied_times_since(datetime.now() - timedelta(hours=24))
+        if not times: return 60 # Slots are all reserved by busy workers
+        return max(60, (times[0] + timedelta(hours=24) - datetime.now()).total_seconds())
+
+    def can_apply(self, now=None):
+        return self.wait_time(now) <= 0
+
+    def headroom(self, now=None):
+        # A worker holds one reserved slot at a time
+        return 1 if self.can_apply(now) else 0
+
+    def record(self, now=None):
+        self.local.record(now)
+
+def sleep_until_slot(limiter):
+    wait = limiter.wait_time()
+    if wait <= 0: return
+    resume_at = datetime.now() + timedelta(seconds=wait)
+    print(f"[LIMIT] Quota full ({limiter.used()} / {DAILY_LIMIT}). Sleeping until {resume_at.strftime('%H:%M:%S')}...")
+    time.sleep(wait + 1)
+
+# --- TRACING ---
+
+def percentile(values, pct):
+    if not values: return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+class Tracer:
+    """
+    Low-overhead span timer for the apply loop. A span costs two perf_counter()
+    reads and a list append; spans are written once per job as one JSON line.
+    Disabled (no-op spans) until start() is called.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.file = None
+        self.commands = Counter()
+        self.durations = defaultdict(list)
+        self.spans = []
+        self.job_id = None
+        self.job_start = 0.0
+        self.job_commands = 0
+
+    def start(self, path, commands):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.file = open(path, 'a', encoding='utf-8')
+        self.commands = commands
+        self.enabled = True
+        self.path = path
+
+    @contextmanager
+    def span(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        commands = self.commands['total']
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.durations[name].append(elapsed)
+            self.spans.append((name, round(elapsed * 1000, 2), self.commands['total'] - commands))
+
+    def begin_job(self, job_id):
+        if not self.enabled: return
+        self.job_id = job_id
+        self.spans = []
+        self.job_start = time.perf_counter()
+        self.job_commands = self.commands['total']
+
+    def end_job(self, status):
+        if not self.enabled or self.job_id is None: return
+        elapsed = time.perf_counter() - self.job_start
+        self.durations['job'].append(elapsed)
+        self.file.write(json.dumps({
+            'ts': datetime.now().strftime(DATE_FORMAT),
+            'job_id': self.job_id,
+            'status': status,
+            'ms': round(elapsed * 1000, 2),
+            'commands': self.commands['total'] - self.job_commands,
+            'spans': [{'name': n, 'ms': ms, 'commands': c} for n, ms, c in self.spans],
+        }) + "\n")
+        self.file.flush()
+        self.job_id = None
+
+    def summary(self):
+        return {
+            name: {
+                'count': len(values),
+                'p50_ms': round(percentile(values, 50) * 1000, 1),
+                'p95_ms': round(percentile(values, 95) * 1000, 1),
+                'max_ms': round(max(values) * 1000, 1),
+            }
+            for name, values in sorted(self.durations.items())
+        }
+
+    def close(self):
+        if not self.enabled: return
+        summary = self.summary()
+        self.file.write(json.dumps({'summary': summary}) + "\n")
+        self.file.close()
+        self.enabled = False
+        if summary:
+            print("\n--- STAGE TIMINGS (ms) ---")
+            for name, row in summary.items():
+                print(f"{name:<28} n={row['count']:<5} p50={row['p50_ms']:<8} p95={row['p95_ms']:<8} max={row['max_ms']}")
+            print(f"Trace: {self.path}")
+
+TRACER = Tracer()
+
+def traced(name):
+    """
+    Decorator: times every call of the function as a TRACER span.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with TRACER.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# --- SNAPSHOTS ---
+
+# Outer HTML of the results list, the right pane and the apply modal (null if absent)
+SNAPSHOT_JS = """
+const html = el => el ? el.outerHTML : null;
+let card = document.querySelector("div[data-hook^='job-result-card']");
+return {
+    list: html(card && card.parentElement),
+    pane: html(document.querySelector("div[data-hook='right-content']")),
+    modal: html(document.querySelector("[data-hook='apply-modal-content']") || document.querySelector("[role='dialog']")),
+    url: window.location.href,
+};
+"""
+
+# Whole document without scripts (they would talk to the live site when replayed)
+PAGE_SNAPSHOT_JS = """
+let doc = document.documentElement.cloneNode(true);
+doc.querySelectorAll('script, noscript').forEach(el => el.remove());
+return '<!DOCTYPE html>\\n' + doc.outerHTML;
+"""
+
+def capture_snapshot(driver, ctx, job_id):
+    """
+    Holds the current list/pane/modal HTML for job_id until its outcome is
+    known (see keep_snapshot). Later captures of the same job add parts.
+    """
+    if not ctx.snapshots: return
+    try: parts = driver.execute_script(SNAPSHOT_JS)
+    except WebDriverException as e:
+        log_debug(f"Snapshot failed: {str(e)[:50]}")
+        return
+    held = ctx.held_snapshots.setdefault(job_id, {})
+    held.update({part: html for part, html in parts.items() if html})
+
+def keep_snapshot(ctx, job_id, status):
+    """
+    Stores the held snapshot of job_id if its outcome is in SNAPSHOT_STATUSES
+    or it was sampled; drops it otherwise.
+    """
+    parts = ctx.held_snapshots.pop(job_id, None)
+    if not parts or not ctx.snapshots: return
+    if status not in SNAPSHOT_STATUSES and random.random() >= SNAPSHOT_SAMPLE: return
+    url = parts.pop('url', "")
+    try:
+        for part, html in parts.items():
+            ctx.snapshots.put(html, part, job_id, status, url)
+    except OSError as e:
+        log_debug(f"Snapshot not saved: {e}")
+
+def save_page_snapshot(driver, store, label=""):
+    """On-demand capture of the whole page (scripts removed). Returns its hash."""
+    return store.put(driver.execute_script(PAGE_SNAPSHOT_JS), 'page', status=label, url=driver.current_url)
+
+# --- WAIT ENGINE ---
+
+def count_webdriver_commands(driver, counter=None):
+    """
+    Wraps the driver's command executor so every chromedriver round trip is
+    counted (total and per command name). Returns the live Counter; pass the
+    previous one to keep counting across browser relaunches.
+    """
+    counter = Counter() if counter is None else counter
+    execute = driver.command_executor.execute
+    def counted(command, params=None):
+        counter['total'] += 1
+        counter[command] += 1
+        return execute(command, params)
+    driver.command_executor.execute = counted
+    return counter
+
+def wait_for(driver, condition, timeout, poll=WAIT_POLL):
+    """
+    Polls condition(driver) until it returns something truthy or timeout expires.
+    Returns the condition's value, or None on timeout.
+    """
+    try:
+        return WebDriverWait(
+            driver, timeout, poll_frequency=poll,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+        ).until(condition)
+    except TimeoutException:
+        return None
+
+def element_settled(element):
+    """
+    True once the element is inside the viewport and its position stopped moving
+    (i.e. smooth scrolling / slide-in animation finished).
+    """
+    last = {'rect': None}
+    def condition(driver):
+        rect = driver.execute_script("""
+            let r = arguments[0].getBoundingClientRect();
+            if (r.bottom < 0 || r.top > window.innerHeight) return null;
+            return [Math.round(r.top), Math.round(r.left), Math.round(r.width), Math.round(r.height)];
+        """, element)
+        settled = rect is not None and rect == last['rect']
+        last['rect'] = rect
+        return settled
+    return condition
+
+def pane_shows_job(job_id, previous_text=""):
+    """
+    Returns the pane text once the right pane has rendered the given job.
+    Falls back to 'text changed' when the pane carries no visible Job ID.
+    """
+    def condition(driver):
+        return driver.execute_script("""
+            let id = arguments[0], prev = arguments[1];
+            let pane = document.querySelector("div[data-hook='right-content']");
+            if (!pane) return null;
+            let text = pane.innerText || '';
+            if (!text.trim()) return null;
+            if (id && (location.href.includes(id) || pane.innerHTML.includes(id))) return text;
+            if (prev && text !== prev) return text;
+            return null;
+        """, job_id, previous_text)
+    return condition
+
+def modal_settled():
+    """
+    Returns the apply modal once it is visible and its geometry is stable.
+    """
+    last = {'rect': None}
+    def condition(driver):
+        modal = driver.find_element(By.CSS_SELECTOR, "div[data-hook='apply-modal-content']")
+        if not modal.is_displayed(): return None
+        rect = driver.execute_script("""
+            let r = arguments[0].getBoundingClientRect();
+            return [Math.round(r.top), Math.round(r.left), Math.round(r.width), Math.round(r.height)];
+        """, modal)
+        settled = rect == last['rect']
+        last['rect'] = rect
+        return modal if settled else None
+    return condition
+
+def results_changed(marker):
+    """
+    True once the first result card is no longer `marker` (the next page rendered).
+    """
+    def condition(driver):
+        first = driver.execute_script("""
+            let card = document.querySelector("div[data-hook^='job-result-card']");
+            return card ? card.getAttribute('data-hook') : null;
+        """)
+        return bool(first) and first.split('|')[-1].strip() != marker
+    return condition
+
+def overlays_cleared(driver):
+    return driver.execute_script("""
+        let nodes = document.querySelectorAll("div[data-hook='apply-modal-content'], [role='dialog']");
+        return Array.from(nodes).every(n => n.offsetParent === null);
+    """)
+
+def application_confirmed(driver):
+    pane = driver.find_element(By.CSS_SELECTOR, "div[data-hook='right-content']")
+    text = pane.text.lower()
+    return "withdraw application" in text or "see application" in text or "applied" in text
 
 # --- ROBUST INTERACTION ---
 
+@traced("robust_click")
 def robust_click(driver, element):
     """
     Tries standard click. If blocked by overlay/modal, forces JS click.
@@ -116,8 +1038,12 @@ def robust_click(driver, element):
     except: return False
 
     try:
-        driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-        time.sleep(0.3)
+        if FAST_LOAD:
+            # Instant scroll: nothing to wait for, no animation frames to render
+            driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", element)
+        else:
+            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
+            wait_for(driver, element_settled(element), SCROLL_TIMEOUT)
         element.click()
         return True
     except ElementClickInterceptedException:
@@ -133,6 +1059,7 @@ def robust_click(driver, element):
             return True
         except: return False
 
+@traced("force_clear_overlays")
 def force_clear_overlays(driver):
     """
     Safer cleanup: Presses ESC and JS-clicks known 'Close' buttons.
@@ -154,78 +1081,313 @@ def force_clear_overlays(driver):
             });
         """)
     except: pass
-    time.sleep(0.5)
+    wait_for(driver, overlays_cleared, OVERLAY_TIMEOUT)
 
 # --- DATA EXTRACTION ---
 
-def get_card_data(card_element):
-    data = {'Job ID': 'unknown', 'Company': 'Unknown', 'Title': 'Unknown', 'Job Link': '', 'Location': ''}
+# Reads every result card in ONE round trip. Mirrors the old per-card
+# heuristics: img alt -> company, link aria-label -> title, last lines -> location.
+CARD_SCAN_JS = """
+return Array.from(document.querySelectorAll("div[data-hook^='job-result-card']")).map(card => {
+    let hook = card.getAttribute('data-hook') || '';
+    let lines = (card.innerText || '').split('\\n');
+    let img = card.querySelector('img');
+    let link = card.querySelector('a');
+    let location = '';
+    for (let line of lines.slice(-3)) {
+        if (line.includes(',') || line.includes('Remote')) { location = line; break; }
+    }
+    let id = hook.includes('|') ? hook.split('|')[1].trim() : null;
+    return {
+        id: id,
+        link: id ? window.location.origin + '/jobs/' + id : null,
+        // Job page inside the current search (keeps filters and page in the list)
+        url: id ? window.location.origin + '/job-search/' + id + window.location.search : null,
+        company: img ? img.getAttribute('alt') : (lines.length > 1 ? lines[1] : null),
+        title: link ? (link.getAttribute('aria-label') || link.innerText) : (lines[0] || null),
+        location: location,
+        pay: lines.find(line => line.includes('$')) || null
+    };
+});
+"""
+
+def scan_cards(driver):
+    """
+    Returns one dict per result card (id, link, url, company, title, location, pay).
+    """
     try:
-        hook = card_element.get_attribute("data-hook")
-        if hook and "|" in hook:
-            data['Job ID'] = hook.split("|")[1].strip()
-            data['Job Link'] = f"https://app.joinhandshake.com/jobs/{data['Job ID']}"
+        return driver.execute_script(CARD_SCAN_JS) or []
+    except StaleElementReferenceException:
+        return []
 
-        try:
-            img = card_element.find_element(By.TAG_NAME, "img")
-            data['Company'] = img.get_attribute("alt")
-        except:
-            lines = card_element.text.split('\n')
-            if len(lines) > 1: data['Company'] = lines[1]
+FIND_CARD_JS = """
+return Array.from(document.querySelectorAll("div[data-hook^='job-result-card']")).find(card => {
+    let hook = card.getAttribute('data-hook') || '';
+    return hook.includes('|') && hook.split('|')[1].trim() === arguments[0];
+}) || null;
+"""
 
-        try:
-            link = card_element.find_element(By.TAG_NAME, "a")
-            data['Title'] = link.get_attribute("aria-label") or link.text
-            if "View " in data['Title']: data['Title'] = data['Title'].replace("View ", "")
-        except:
-            lines = card_element.text.split('\n')
-            if lines: data['Title'] = lines[0]
-
-        lines = card_element.text.split('\n')
-        for line in lines[-3:]:
-            if "," in line or "Remote" in line:
-                data['Location'] = line
-                break
-    except Exception: pass 
+def open_job(driver, job, mode=JOB_OPEN_MODE):
+    """
+    Opens a scanned job by its stable data-hook (no index lookups), falling
+    back to the job's URL when the card is no longer in the list.
+    """
+    if mode == "hook":
+        card = driver.execute_script(FIND_CARD_JS, job['id'])
+        if card and robust_click(driver, card): return True
+        log_debug("Card not in list, opening by URL.")
+    if not job.get('url'): return False
+    driver.get(job['url'])
+    return True
+
+def get_card_data(card):
+    """
+    Builds a log row from a scan_cards() entry. No WebDriver calls.
+    """
+    data = {'Job ID': 'unknown', 'Company': 'Unknown', 'Title': 'Unknown', 'Job Link': '', 'Location': ''}
+    if card.get('id'):
+        data['Job ID'] = card['id']
+        data['Job Link'] = card.get('link') or f"https://app.joinhandshake.com/jobs/{data['Job ID']}"
+    if card.get('company') is not None: data['Company'] = card['company']
+    if card.get('title'):
+        data['Title'] = card['title']
+        if "View " in data['Title']: data['Title'] = data['Title'].replace("View ", "")
+    data['Location'] = card.get('location') or ''
+    data['Pay'] = card.get('pay') or ''
+    data['Job Type'] = card.get('job_type') or ''
     return data
 
-def check_modal_requirements(modal):
+def filter_reason(data):
+    """
+    Why a job should be dropped before it is opened, or None to process it.
+    """
+    if data.get('Job Type') and data['Job Type'] in SKIP_JOB_TYPES:
+        return f"Job Type: {data['Job Type']}"
+    if data.get('Company') in EXCLUDE_COMPANIES:
+        return f"Company: {data['Company']}"
+    title = (data.get('Title') or "").lower()
+    for keyword in EXCLUDE_TITLE_KEYWORDS:
+        if keyword.lower() in title: return f"Title: {keyword}"
+    location = data.get('Location') or ""
+    for excluded in EXCLUDE_LOCATIONS:
+        if excluded.lower() in location.lower(): return f"Location: {excluded}"
+    if REMOTE_ONLY and "remote" not in location.lower():
+        return "Not remote"
+    if MIN_HOURLY_PAY:
+        pay = parse_pay(data.get('Pay'))
+        if pay and pay[1] < MIN_HOURLY_PAY: return f"Pay: {data['Pay']}"
+    return None
+
+PAY_RE = re.compile(
+    r"\$\s*([\d,.]+)\s*(k)?(?:\s*[-–—]\s*\$?\s*([\d,.]+)\s*(k)?)?\s*(?:/|per\s+)?\s*(hr|hour|h|wk|week|mo|month|yr|year|annually)?",
+    re.IGNORECASE)
+HOURS_PER = {'hr': 1, 'hour': 1, 'h': 1, 'wk': 40, 'week': 40, 'mo': 2080 / 12, 'month': 2080 / 12,
+             'yr': 2080, 'year': 2080, 'annually': 2080}
+
+def parse_pay(text):
+    """
+    Hourly (low, high) dollars from a pay string as displayed: '$36–45/hr',
+    '$11–20K/mo', '$80,000/yr'. None when there is no amount.
+    """
+    match = PAY_RE.search(text or "")
+    if not match: return None
+    low_text, low_k, high_text, high_k, unit = match.groups()
+    try:
+        low = float(low_text.replace(',', ''))
+        high = float(high_text.replace(',', '')) if high_text else low
+    except ValueError:
+        return None
+    if high_k: high *= 1000
+    if low_k or (high_k and low < 1000): low *= 1000 # '$11–20K' means 11K–20K
+    hours = HOURS_PER.get((unit or "").lower()) or (2080 if high >= 1000 else 1)
+    return low / hours, high / hours
+
+def days_since(posted):
+    try: posted_at = datetime.fromisoformat(str(posted).replace('Z', '+00:00'))
+    except ValueError: return None
+    if posted_at.tzinfo: posted_at = posted_at.astimezone().replace(tzinfo=None)
+    return max(0.0, (datetime.now() - posted_at).total_seconds() / 86400)
+
+# --- NETWORK CAPTURE ---
+
+def _first(obj, *keys):
+    for key in keys:
+        value = obj.get(key)
+        if value not in (None, "", [], {}): return value
+    return None
+
+def _name(value):
+    if isinstance(value, dict): return _first(value, 'name', 'label', 'text', 'display_name', 'displayName')
+    return value
+
+def format_pay(value):
+    """
+    Pay as the site displays it ('$36–45/hr'), from either a display string or
+    a {min, max, schedule} range object.
+    """
+    if isinstance(value, str): return value if "$" in value else None
+    if not isinstance(value, dict): return None
+    text = _first(value, 'text', 'label', 'display', 'displayText', 'formatted')
+    if isinstance(text, str): return text
+    low, high = _first(value, 'min', 'minimum', 'low', 'amountMin'), _first(value, 'max', 'maximum', 'high', 'amountMax')
+    if low is None and high is None: return None
+    schedule = str(_first(value, 'schedule', 'pay_schedule', 'paySchedule', 'interval') or "").lower()
+    unit = "/mo" if "month" in schedule else "/yr" if "year" in schedule or "annual" in schedule else "/hr"
+    amounts = [f"{float(x):g}" for x in (low, high) if x is not None]
+    return "$" + "–".join(dict.fromkeys(amounts)) + unit
+
+def parse_job_record(obj):
+    """
+    Maps one job object from a JSON response to log fields, or None if the
+    object does not look like a job posting.
+    """
+    if 'id' not in obj or not isinstance(obj.get('title'), str): return None
+    employer = _first(obj, 'employer', 'company', 'employer_name', 'employerName', 'companyName')
+    if employer is None: return None
+
+    location = _first(obj, 'location', 'location_name', 'locationName', 'locations')
+    if isinstance(location, list):
+        location = "; ".join(str(_name(l)) for l in location if _name(l))
+    location = _name(location)
+    if not location and _first(obj, 'remote', 'is_remote', 'isRemote'): location = "Remote"
+
+    return {
+        'id': str(obj['id']),
+        'company': _name(employer),
+        'title': obj['title'],
+        'location': location or None,
+        'pay': format_pay(_first(obj, 'pay', 'salary', 'salary_range', 'salaryRange', 'compensation')),
+        'job_type': _name(_first(obj, 'job_type', 'jobType', 'employment_type', 'employmentType')),
+        'posted': _first(obj, 'created_at', 'createdAt', 'posted_at', 'postedAt', 'published_at'),
+    }
+
+def walk_job_records(node, found):
+    if isinstance(node, dict):
+        record = parse_job_record(node)
+        if record: found[record['id']] = record
+        for value in node.values(): walk_job_records(value, found)
+    elif isinstance(node, list):
+        for value in node: walk_job_records(value, found)
+    return found
+
+class JobFeedCapture:
+    """
+    Collects job records from the JSON responses the search page already fetches.
+    Response URLs come from Chrome's performance log; finished bodies are read with
+    CDP Network.getResponseBody. One harvest() covers a whole page of cards.
+    """
+    def __init__(self):
+        self.jobs = {}
+        self.pending = {} # requestId -> url, waiting for loadingFinished
+
+    def harvest(self, driver):
+        """
+        Parses every finished JSON response since the last call. Returns new job count.
+        """
+        try: entries = driver.get_log("performance")
+        except WebDriverException: return 0
+
+        finished = []
+        for entry in entries:
+            try: message = json.loads(entry['message'])['message']
+            except (ValueError, KeyError): continue
+            method, params = message.get('method'), message.get('params', {})
+            if method == 'Network.responseReceived':
+                response = params.get('response', {})
+                url = response.get('url', '').lower()
+                if 'json' in response.get('mimeType', '') and any(h in url for h in JOB_FEED_URL_HINTS):
+                    self.pending[params.get('requestId')] = url
+            elif method == 'Network.loadingFinished' and params.get('requestId') in self.pending:
+                finished.append(params['requestId'])
+
+        before = len(self.jobs)
+        for request_id in finished:
+            self.pending.pop(request_id, None)
+            try:
+                body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                text = body.get('body', '')
+                if body.get('base64Encoded'): text = base64.b64decode(text).decode('utf-8', errors='replace')
+                walk_job_records(json.loads(text), self.jobs)
+            except (WebDriverException, ValueError):
+                continue # Body evicted or not JSON after all
+        return len(self.jobs) - before
+
+    def enrich(self, card):
+        """
+        Fills a scan_cards() entry from the captured feed (feed wins for pay and job type).
+        """
+        record = self.jobs.get(card.get('id'))
+        if not record: return card
+        merged = dict(card)
+        for key in ('company', 'title', 'location'):
+            if not merged.get(key) and record.get(key): merged[key] = record[key]
+        for key in ('pay', 'job_type', 'posted'):
+            if record.get(key): merged[key] = record[key]
+        return merged
+
+# Classifies the apply modal in ONE round trip. Same rules as the old
+# per-input loop: skipped input types, resume search boxes, visible fields only.
+MODAL_ANALYZE_JS = """
+let modal = arguments[0];
+let text = (modal.innerText || '').toLowerCase();
+let visible = el => {
+    let style = window.getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden'
+        && style.display !== 'none' && style.opacity !== '0';
+};
+let result = {
+    cover_letter: text.includes('cover letter'),
+    transcript: text.includes('transcript'),
+    other_docs: text.includes('other required documents'),
+    choice_questions: Array.from(modal.querySelectorAll('input')).some(
+        inp => inp.type === 'radio' || inp.type === 'checkbox'),
+    text_questions: false,
+    document_selector: null
+};
+let skip = ['hidden', 'submit', 'button', 'file', 'radio', 'checkbox'];
+for (let inp of modal.querySelectorAll('input, textarea, select')) {
+    if (skip.includes(inp.type)) continue;
+    let placeholder = (inp.getAttribute('placeholder') || '').toLowerCase();
+    let label = (inp.getAttribute('aria-label') || '').toLowerCase();
+    if (placeholder.includes('search') || placeholder.includes('filter')) {
+        if (!placeholder.includes('resume') && !label.includes('resume')) {
+            result.document_selector = placeholder;
+            break;
+        }
+        continue;
+    }
+    if (visible(inp)) { result.text_questions = true; break; }
+}
+return result;
+"""
+
+def analyze_modal(driver, modal):
+    """
+    Returns the structured barrier analysis of the apply modal, or None if it failed.
+    """
+    try:
+        return driver.execute_script(MODAL_ANALYZE_JS, modal)
+    except Exception:
+        return None
+
+@traced("check_modal_requirements")
+def check_modal_requirements(driver, modal):
     barriers = []
-    text = modal.text.lower()
+    result = analyze_modal(driver, modal)
+    if not result: return barriers
     
-    if "cover letter" in text: barriers.append("Cover Letter")
-    if "transcript" in text: barriers.append("Transcript")
-    if "other required documents" in text: barriers.append("Other Docs")
-    
-    try:
-        all_inputs = modal.find_elements(By.TAG_NAME, "input")
-        for inp in all_inputs:
-            itype = inp.get_attribute("type")
-            if itype in ["radio", "checkbox"]:
-                barriers.append("Questions (Checkbox/Radio)")
-                break
-        
-        inputs = modal.find_elements(By.CSS_SELECTOR, "input, textarea, select")
-        for inp in inputs:
-            itype = inp.get_attribute("type")
-            placeholder = (inp.get_attribute("placeholder") or "").lower()
-            label = (inp.get_attribute("aria-label") or "").lower()
-            
-            if itype in ["hidden", "submit", "button", "file", "radio", "checkbox"]: continue
-            
-            if "search" in placeholder or "filter" in placeholder:
-                if "resume" not in placeholder and "resume" not in label:
-                    barriers.append(f"Document Selector ({placeholder})")
-                    break
-                else: continue
-            
-            if inp.is_displayed():
-                barriers.append("Questions (Text)")
-                break
-    except: pass
+    if result['cover_letter']: barriers.append("Cover Letter")
+    if result['transcript']: barriers.append("Transcript")
+    if result['other_docs']: barriers.append("Other Docs")
+    if result['choice_questions']: barriers.append("Questions (Checkbox/Radio)")
+    if result['document_selector'] is not None:
+        barriers.append(f"Document Selector ({result['document_selector']})")
+    elif result['text_questions']:
+        barriers.append("Questions (Text)")
     
     return barriers
 
+@traced("handle_resume_selection")
 def handle_resume_selection(driver, modal):
     try:
         resume_inputs = modal.find_elements(By.CSS_SELECTOR, "input[placeholder*='Search your resumes']")
@@ -235,284 +1397,1752 @@ def handle_resume_selection(driver, modal):
                 if not current_val:
                     log_debug("Selecting resume...")
                     robust_click(driver, inp)
-                    time.sleep(1.0) # WAIT for dropdown animation
+                    # WAIT for dropdown options to render
+                    options = wait_for(driver, lambda d: [o for o in d.find_elements(By.CSS_SELECTOR, "div[role='option']") if o.is_displayed()], 1.0)
                     
                     try:
-                        options = driver.find_elements(By.CSS_SELECTOR, "div[role='option']")
                         if options:
                             robust_click(driver, options[0])
                         else:
                             inp.send_keys(Keys.ARROW_DOWN)
-                            time.sleep(0.5)
                             inp.send_keys(Keys.ENTER)
                     except: pass
 
-                    time.sleep(0.5)
+                    wait_for(driver, lambda d: inp.get_attribute("value"), 0.5)
                     try: modal.click() # Unfocus
                     except: pass
     except: pass
 
+# Armed right BEFORE the Submit click. A MutationObserver resolves
+# window.__hsApplyDone with 'success' when a new withdraw / see-application /
+# applied marker shows up in the pane, or 'error: <text>' when a new alert appears.
+ARM_APPLY_WATCH_JS = """
+let paneText = () => {
+    let pane = document.querySelector("div[data-hook='right-content']");
+    return (pane ? pane.innerText : '').toLowerCase();
+};
+let markers = text => ['withdraw application', 'see application', 'applied'].filter(m => text.includes(m));
+let alertSelector = "[role='alert'], [aria-live='assertive']";
+let baseline = markers(paneText());
+let oldAlerts = new Set(document.querySelectorAll(alertSelector));
+let check = () => {
+    if (markers(paneText()).some(m => !baseline.includes(m))) return 'success';
+    for (let alert of document.querySelectorAll(alertSelector)) {
+        let text = (alert.innerText || '').trim();
+        if (!oldAlerts.has(alert) && alert.offsetParent !== null && text) return 'error: ' + text.slice(0, 80);
+    }
+    return null;
+};
+if (window.__hsApplyObserver) window.__hsApplyObserver.disconnect();
+window.__hsApplyResult = null;
+window.__hsApplyDone = new Promise(resolve => {
+    let observer = new MutationObserver(() => {
+        let result = check();
+        if (!result) return;
+        observer.disconnect();
+        window.__hsApplyResult = result;
+        resolve(result);
+    });
+    window.__hsApplyObserver = observer;
+    observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+});
+"""
+
+# Async: waits for the armed observer's verdict, or returns null after arguments[0] ms.
+AWAIT_APPLY_RESULT_JS = """
+let done = arguments[arguments.length - 1];
+if (!window.__hsApplyDone) return done(null);
+let timer = setTimeout(() => done(window.__hsApplyResult), arguments[0]);
+window.__hsApplyDone.then(result => { clearTimeout(timer); done(result); });
+"""
+
+def arm_success_watch(driver):
+    try:
+        driver.execute_script(ARM_APPLY_WATCH_JS)
+        return True
+    except WebDriverException:
+        return False
+
+@traced("await_apply_outcome")
+def await_apply_outcome(driver, timeout):
+    """
+    Returns 'success', 'error: <banner text>' or None (no verdict within timeout).
+    Resolves the moment the page reacts instead of sleeping a fixed delay.
+    """
+    try:
+        return driver.execute_async_script(AWAIT_APPLY_RESULT_JS, int(timeout * 1000))
+    except WebDriverException:
+        return None
+
+@traced("verify_application_success")
 def verify_application_success(driver):
     try:
-        time.sleep(2.0) # Wait for success message to animate in
-        pane = driver.find_element(By.CSS_SELECTOR, "div[data-hook='right-content']")
-        text = pane.text.lower()
-        if "withdraw application" in text or "see application" in text or "applied" in text:
+        # Returns as soon as the success marker renders
+        if wait_for(driver, application_confirmed, VERIFY_TIMEOUT):
             return True
     except: pass
     return False
 
-# --- MAIN BOT ---
+# --- BARRIER PREDICTOR ---
 
-def run_bot():
-    csv_path = get_csv_filepath()
-    init_csv(csv_path)
-    history = load_history(csv_path)
-    
-    applied_24h = count_applications_last_24h(csv_path)
-    print(f"\n[LIMIT] Applications in last 24h: {applied_24h} / {DAILY_LIMIT}")
-    
-    if applied_24h >= DAILY_LIMIT:
-        print("[STOP] Daily limit reached.")
-        return
+TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+# Pane phrases that tend to come with extra documents or questions in the modal
+PANE_CUES = [
+    "cover letter", "transcript", "writing sample", "portfolio", "references",
+    "gpa", "essay", "work authorization", "sponsorship", "questions",
+]
+PREDICTED_PREFIX = "Predicted: "
 
-    options = Options()
-    options.add_argument(f"user-data-dir={CHROME_PROFILE}") 
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.page_load_strategy = 'eager' 
-    
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    wait = WebDriverWait(driver, 5)
+class BarrierPredictor:
+    """
+    Naive Bayes over company, title tokens and pane cues, learned from logged
+    outcomes: 'Saved' rows met a barrier in the modal, 'APPLIED' and 'Failed'
+    rows got through it. A Job ID already known to have barriers is certain.
+    The model file remembers how far each CSV log was read, so startup only
+    learns from rows appended since; modals seen live are learned with their
+    pane text.
+    """
+    def __init__(self, path=BARRIER_MODEL):
+        self.path = path
+        self.totals = Counter()                     # 'barrier' / 'clean' -> rows
+        self.counts = {'barrier': Counter(), 'clean': Counter()}
+        self.names = defaultdict(Counter)           # company -> barrier names seen
+        self.barrier_ids = set()
+        self.offsets = {}
+        self.session = Counter()                    # predictions / spot checks this run
 
+    @classmethod
+    def load(cls, filepaths, path=BARRIER_MODEL):
+        model = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            model.totals = Counter(saved['totals'])
+            model.counts = {label: Counter(saved['counts'][label]) for label in ('barrier', 'clean')}
+            model.names = defaultdict(Counter, {k: Counter(v) for k, v in saved['names'].items()})
+            model.barrier_ids = set(saved['barrier_ids'])
+            model.offsets = saved['logs']
+        except (OSError, ValueError, KeyError):
+            pass
+        for path in filepaths:
+            name = os.path.basename(path)
+            offset = model.offsets.get(name, 0)
+            if os.path.exists(path) and os.path.getsize(path) < offset: offset = 0 # Rewritten
+            progress = {'offset': offset}
+            try:
+                for row in read_log_rows(path, offset, progress):
+                    model.learn_row(row)
+            except OSError: continue
+            model.offsets[name] = progress['offset']
+        return model
+
+    def save(self, filepaths=()):
+        for path in filepaths:
+            # Rows logged this run were learned live (with pane text)
+            try: self.offsets[os.path.basename(path)] = os.path.getsize(path)
+            except OSError: pass
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'totals': self.totals, 'counts': self.counts, 'names': self.names,
+                           'barrier_ids': sorted(self.barrier_ids), 'logs': self.offsets}, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[ERROR] Barrier model: {e}")
+
+    def features(self, company, title, pane_text=""):
+        feats = set()
+        if company: feats.add("company:" + company.strip().lower())
+        feats.update("title:" + t for t in TOKEN_RE.findall((title or "").lower()) if len(t) > 2 and not t.isdigit())
+        text = pane_text.lower()
+        feats.update("cue:" + cue for cue in PANE_CUES if cue in text)
+        return feats
+
+    def learn(self, data, barriers, pane_text=""):
+        """
+        One modal outcome: barriers is the check_modal_requirements() list.
+        """
+        label = 'barrier' if barriers else 'clean'
+        self.totals[label] += 1
+        self.counts[label].update(self.features(data.get('Company'), data.get('Title'), pane_text))
+        if barriers:
+            self.barrier_ids.add(data['Job ID'])
+            self.names[(data.get('Company') or "").strip().lower()].update(barriers)
+
+    def learn_row(self, row):
+        status, requirements = row.get('Status'), row.get('Requirements') or ""
+        if requirements.startswith(PREDICTED_PREFIX): return # Never learn from our own guesses
+        if status == 'Saved' and requirements:
+            self.learn(row, [b.strip() for b in requirements.split(",") if b.strip()])
+        elif status in ('APPLIED', 'Failed'):
+            self.learn(row, [])
+
+    def probability(self, feats):
+        """
+        P(barrier | feats) and the support behind it. Title tokens are
+        correlated, so they count once, as their mean log-likelihood ratio;
+        support is the most rows behind a company or pane-cue feature.
+        """
+        barrier, clean = self.totals['barrier'], self.totals['clean']
+        if not barrier or not clean: return None, 0
+        log_odds = math.log(barrier / clean)
+        support = 0
+        title_ratios = []
+        for feat in feats:
+            hits, misses = self.counts['barrier'][feat], self.counts['clean'][feat]
+            if not hits and not misses: continue
+            ratio = math.log((hits + 1) / (barrier + 2)) - math.log((misses + 1) / (clean + 2))
+            if feat.startswith("title:"):
+                title_ratios.append(ratio)
+            else:
+                log_odds += ratio
+                support = max(support, hits + misses)
+        if title_ratios:
+            log_odds += sum(title_ratios) / len(title_ratios)
+        return 1 / (1 + math.exp(-max(-50, min(50, log_odds)))), support
+
+    def likely_barriers(self, company):
+        names = self.names.get((company or "").strip().lower())
+        if not names:
+            names = sum(self.names.values(), Counter())
+        top = [name for name, _ in names.most_common(3)]
+        return ", ".join(top) or "Unknown"
+
+    def predict(self, data, pane_text=""):
+        """
+        Returns (probability, barrier names) when the job very likely has barriers, else None.
+        """
+        if data.get('Job ID') in self.barrier_ids:
+            return 1.0, self.likely_barriers(data.get('Company'))
+        p, support = self.probability(self.features(data.get('Company'), data.get('Title'), pane_text))
+        if p is None or p < BARRIER_THRESHOLD or support < BARRIER_MIN_SUPPORT: return None
+        return p, self.likely_barriers(data.get('Company'))
+
+    def summary(self):
+        s = self.session
+        line = f"[PREDICT] Modals skipped: {s['skipped']} of {s['predicted']} predicted"
+        if s['spot_checks']:
+            line += f" | spot checks {s['spot_hits']}/{s['spot_checks']} correct ({s['spot_hits'] / s['spot_checks']:.0%})"
+        return line
+
+def predicted_save(ctx, data, pane_text, say=print):
+    """
+    Logs the job as Saved without opening the modal when the predictor is
+    confident. A BARRIER_SPOT_CHECK share of predictions opens the modal anyway;
+    returns the prediction then, so the caller can score it.
+    Returns (skipped, prediction).
+    """
+    if not ctx.predictor: return False, None
+    guess = ctx.predictor.predict(data, pane_text)
+    if not guess: return False, None
+    ctx.predictor.session['predicted'] += 1
+    if random.random() < BARRIER_SPOT_CHECK:
+        return False, guess
+    p, names = guess
+    say(f"    [SAVE] Predicted barriers: {names} ({p:.0%})")
+    data['Status'] = 'Saved'
+    data['Requirements'] = f"{PREDICTED_PREFIX}{names}"
+    ctx.predictor.session['skipped'] += 1
+    ctx.record(data)
+    return True, guess
+
+def learn_modal(ctx, data, barriers, pane_text, guess=None):
+    if not ctx.predictor: return
+    ctx.predictor.learn(data, barriers, pane_text)
+    if guess:
+        ctx.predictor.session['spot_checks'] += 1
+        if barriers: ctx.predictor.session['spot_hits'] += 1
+
+def evaluate_predictor(filepaths, holdout=0.2):
+    """
+    Expected hit rates: trains on the older rows of every log and scores the
+    newest `holdout` share. Returns a dict of counts and rates.
+    """
+    rows = []
+    for path in filepaths:
+        try: rows.extend(r for r in read_log_rows(path) if r['Status'] in ('Saved', 'APPLIED', 'Failed'))
+        except OSError: pass
+    rows = [r for r in rows if not r['Requirements'].startswith(PREDICTED_PREFIX)]
+    rows.sort(key=lambda r: r['Date'])
+    split = int(len(rows) * (1 - holdout))
+    model = BarrierPredictor(path=None)
+    for row in rows[:split]: model.learn_row(row)
+
+    result = dict.fromkeys(('barrier', 'clean', 'predicted', 'correct'), 0)
+    for row in rows[split:]:
+        actual = row['Status'] == 'Saved' and bool(row['Requirements'])
+        result['barrier' if actual else 'clean'] += 1
+        p, support = model.probability(model.features(row['Company'], row['Title']))
+        if p is not None and p >= BARRIER_THRESHOLD and support >= BARRIER_MIN_SUPPORT:
+            result['predicted'] += 1
+            if actual: result['correct'] += 1
+    result['train_rows'], result['test_rows'] = split, len(rows) - split
+    result['precision'] = result['correct'] / result['predicted'] if result['predicted'] else 0.0
+    result['coverage'] = result['correct'] / result['barrier'] if result['barrier'] else 0.0
+    return result
+
+# --- BROWSER ---
+
+def has_login_cookies(profile_dir):
+    """
+    True if the Chrome profile holds Handshake cookies (i.e. a previous headed
+    run logged in). Reads a copy of the cookie DB, Chrome may hold a lock on it.
+    """
+    for rel in (os.path.join("Default", "Network", "Cookies"), os.path.join("Default", "Cookies")):
+        path = os.path.join(profile_dir, rel)
+        if not os.path.exists(path): continue
+        fd, copy = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        try:
+            shutil.copyfile(path, copy)
+            conn = sqlite3.connect(copy)
+            try:
+                count = conn.execute("SELECT COUNT(*) FROM cookies WHERE host_key LIKE '%joinhandshake.com'").fetchone()[0]
+            finally:
+                conn.close()
+            if count: return True
+        except (OSError, sqlite3.Error): pass
+        finally:
+            os.remove(copy)
+    return False
+
+def build_chrome_options(profile_dir, headless=False):
+    options = Options()
+    options.add_argument(f"user-data-dir={profile_dir}") 
+    options.add_argument("--start-maximized")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    if CAPTURE_JOB_FEED:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+    if FAST_LOAD:
+        options.add_argument("--disable-smooth-scrolling")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    options.page_load_strategy = 'eager' 
+    return options
+
+def apply_resource_blocking(driver):
+    """
+    Blocks images, media, fonts and analytics in the current tab via CDP.
+    Has to be applied to every tab the bot opens.
+    """
+    if not FAST_LOAD: return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except WebDriverException as e:
+        log_debug(f"Resource blocking unavailable: {str(e)[:60]}")
+
+def launch_driver(profile_dir, headless=False):
+    driver = driverFactory.create_driver(build_chrome_options(profile_dir, headless), DEBUG_PORT)
+    driver.set_script_timeout(SUBMIT_TIMEOUT + 5) # Outlives await_apply_outcome's own timer
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    apply_resource_blocking(driver)
+    return driver
+
+# --- MAIN BOT ---
+
+RELOAD_PAGE = "reload"
+
+class WorkerContext:
+    """
+    Identity of one worker in a multi-process pool. Jobs are split between
+    workers by a stable hash of the Job ID.
+    """
+    def __init__(self, index, count):
+        self.index = index
+        self.count = count
+        self.name = f"worker{index}"
+
+    def owns(self, job_id):
+        return zlib.crc32(job_id.encode()) % self.count == self.index
+
+class RetryQueue:
+    """
+    Jobs that failed for a transient reason (job or modal did not load, no
+    Submit button, submit not verified), persisted as JSON. They stay out of
+    history and come back with exponential backoff; once RETRY_BUDGET
+    attempts are used up the failure is logged for good.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.entries = {} # Job ID -> {'job', 'attempts', 'next_at', 'reason'}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError): pass
+
+    def __contains__(self, job_id):
+        return job_id in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def defer(self, job, reason):
+        """
+        Schedules another attempt. Returns the delay in seconds, or None once
+        the budget is spent (the entry is dropped and the caller logs the failure).
+        """
+        entry = self.entries.setdefault(job['id'], {'job': job, 'attempts': 0})
+        entry['attempts'] += 1
+        entry['reason'] = reason
+        if entry['attempts'] >= RETRY_BUDGET:
+            self.resolved(job['id'])
+            return None
+        delay = RETRY_BACKOFF * 2 ** (entry['attempts'] - 1)
+        entry['next_at'] = time.time() + delay
+        self.save()
+        return delay
+
+    def due(self, now=None):
+        now = now or time.time()
+        ready = [e for e in self.entries.values() if e['next_at'] <= now]
+        return [e['job'] for e in sorted(ready, key=lambda e: e['next_at'])]
+
+    def resolved(self, job_id):
+        if self.entries.pop(job_id, None) is not None: self.save()
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log_debug(f"Retry queue not saved: {e}")
+
+class BotContext:
+    """
+    State the apply loop carries from one job to the next: history, log,
+    quota, worker identity and per-session UI state.
+    """
+    def __init__(self, store, log, limiter, worker=None):
+        self.store = store
+        self.history = store.seen_jobs()
+        self.log = log
+        self.limiter = limiter
+        self.worker = worker
+        self.consecutive_failures = 0
+        self.pane_text = ""
+        self.jobs_done = 0
+        self.applied = 0
+        self.statuses = Counter()
+        self.last_status = None
+        self.job_durations = []
+        self.feed = JobFeedCapture() if CAPTURE_JOB_FEED else None
+        self.commands = Counter() # Filled by count_webdriver_commands() once a driver exists
+        self.started = time.time()
+        # Supervisor state, kept across browser relaunches
+        self.pending = deque()
+        self.current_job = None
+        self.crashes = Counter()
+        self.restarts = 0
+        self.downtime = 0.0
+        self.memory = MemoryMonitor()
+        self.predictor = None # BarrierPredictor, set by run_bot
+        self.retries = None # RetryQueue, set by run_bot
+        self.snapshots = None # snapshotStore.SnapshotStore when SNAPSHOTS is on
+        self.held_snapshots = {} # Job ID -> captured parts awaiting the outcome
+        self.deferred = 0
+
+    def record(self, data):
+        if WATCHDOG.fired:
+            # Half-finished job on a killed browser: retry it after the relaunch
+            raise SessionLost("Watchdog killed the browser")
+        if self.retries is not None: self.retries.resolved(data['Job ID'])
+        keep_snapshot(self, data['Job ID'], data.get('Status'))
+        self.log.write(data)
+        self.store.record(data)
+        self.history.add(data['Job ID'])
+        self.last_status = data.get('Status')
+        self.jobs_done += 1
+        self.statuses[data.get('Status')] += 1
+        if data.get('Status') == 'APPLIED': self.applied += 1
+
+    @contextmanager
+    def timed_job(self, job):
+        start = time.perf_counter()
+        self.last_status = None
+        self.current_job = job
+        WATCHDOG.beat()
+        TRACER.begin_job(job['id'])
+        try:
+            yield
+            self.current_job = None
+        finally:
+            self.job_durations.append(time.perf_counter() - start)
+            TRACER.end_job(self.last_status or 'Not Logged')
+
+    def transient_failure(self, job, data, reason, say=print):
+        """
+        Defers a transient failure to the retry queue; logs it as Failed once
+        the retry budget is used up.
+        """
+        delay = self.retries.defer(job, reason) if self.retries is not None else None
+        if delay is not None:
+            say(f"    [RETRY] {reason}. Trying again in {delay / 60:.0f} min.")
+            self.deferred += 1
+            keep_snapshot(self, job['id'], 'Retry')
+            return
+        say(f"    [FAIL] {reason}")
+        data['Status'] = 'Failed'
+        data['Requirements'] = reason
+        self.record(data)
+
+    def wants(self, job):
+        if not job['id'] or job['id'] in self.history: return False
+        if self.retries is not None and job['id'] in self.retries: return False # Comes back through run_due_retries()
+        return self.worker is None or self.worker.owns(job['id'])
+
+    def claim(self, job):
+        return self.worker is None or self.store.claim(job['id'], self.worker.name)
+
+    def stats(self):
+        return {
+            'jobs': self.jobs_done,
+            'applied': self.applied,
+            'elapsed_s': time.time() - self.started,
+            'statuses': dict(self.statuses),
+            'job_durations': list(self.job_durations),
+            'commands': self.commands['total'],
+            'restarts': self.restarts,
+            'downtime_s': self.downtime,
+            'recycles': self.memory.recycles,
+            'peak_rss_mb': self.memory.peak_rss,
+            'peak_js_heap_mb': self.memory.peak_heap,
+            'predicted_saves': self.predictor.session['skipped'] if self.predictor else 0,
+            'deferred': self.deferred,
+        }
+
+SESSION_DEAD_MARKERS = (
+    "invalid session", "disconnected", "chrome not reachable",
+    "timed out receiving message from renderer",
+    "max retries exceeded", "connection refused",  # chromedriver itself is gone
+)
+
+def is_session_dead(error):
+    if WATCHDOG.fired: return True
+    err_msg = str(error).lower()
+    return any(marker in err_msg for marker in SESSION_DEAD_MARKERS)
+
+def pane_verdict(pane, pane_text):
+    """
+    Returns (status, note, apply_btn). status is set when the job can be logged
+    from the pane alone (already applied, external, no Apply button).
+    """
+    if "Applied" in pane_text or "See application" in pane_text:
+        return 'Skipped', "[SKIP] Already Applied", None
     try:
-        driver.get("https://app.joinhandshake.com/job-search")
-        input("\n[PAUSE] Log in, Filter, and Press ENTER to start...")
+        apply_btn = pane.find_element(By.XPATH, ".//button[contains(., 'Apply')]")
+    except NoSuchElementException:
+        status = 'External' if "Apply externally" in pane_text else 'No Button'
+        return status, f"[SKIP] {status}", None
+    if "external" in apply_btn.text.lower():
+        return 'External', "[SAVE] External Link", None
+    return None, None, apply_btn
+
+def record_outcome(ctx, job, data, outcome, say=print):
+    """
+    Logs a submitted application from its outcome ('success', 'error: ...' or
+    None). An unverified submit is retried later instead of logged as Failed.
+    """
+    if outcome == 'success':
+        say(f"    [SUCCESS] Application Verified!")
+        data['Status'] = 'APPLIED'
+        data['Requirements'] = 'Resume Only'
+        ctx.limiter.record()
+    elif outcome:
+        say(f"    [FAIL] {outcome}")
+        data['Status'] = 'Failed'
+        data['Requirements'] = f"Validation Error ({outcome[len('error: '):]})"
+    else:
+        # It may have gone through: count it against the quota either way
+        ctx.limiter.record()
+        ctx.transient_failure(job, data, 'Validation Error (Not Verified)', say)
+        return
+    ctx.record(data)
+
+def process_job(driver, job, ctx):
+    """
+    Opens one scanned job and applies to, saves or skips it.
+    Returns RELOAD_PAGE when repeated modal failures call for a page refresh.
+    """
+    data = get_card_data(job)
+    data['Date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    print(f" -> {data['Company']} | {data['Title']}")
+
+    reason = filter_reason(data)
+    if reason:
+        print(f"    [SKIP] Filtered ({reason})")
+        data['Status'] = 'Filtered'
+        data['Requirements'] = reason
+        ctx.record(data)
+        return
+
+    # 1. OPEN JOB (card by data-hook, or by URL)
+    with TRACER.span("stage.open_job"):
+        opened = open_job(driver, job)
+    if not opened:
+        ctx.transient_failure(job, data, 'Job did not open')
+        return
+    
+    # Wait for the pane to switch to this job
+    with TRACER.span("stage.pane_load"):
+        pane_loaded = wait_for(driver, pane_shows_job(data['Job ID'], ctx.pane_text), PANE_TIMEOUT)
+    if not pane_loaded:
+        log_debug("Pane did not switch to job in time.")
+    
+    # 2. FOCUS PANE (Fix for dead clicks)
+    with TRACER.span("stage.pane_focus"):
+        try:
+            pane = driver.find_element(By.CSS_SELECTOR, "div[data-hook='right-content']")
+            robust_click(driver, pane) # Focus click
+        except: 
+            log_debug("Could not focus pane.")
+            pass
+
+    # 3. GET INFO
+    with TRACER.span("stage.pane_read"):
+        try:
+            pane = driver.find_element(By.CSS_SELECTOR, "div[data-hook='right-content']")
+            ctx.pane_text = pane.text
+            if not data.get('Pay') and "$" in ctx.pane_text:
+                for line in ctx.pane_text.split('\n'):
+                    if "$" in line: data['Pay'] = line; break
+        except: ctx.pane_text = ""
+    capture_snapshot(driver, ctx, data['Job ID'])
+
+    status, note, apply_btn = pane_verdict(pane, ctx.pane_text)
+    if status:
+        print(f"    {note}")
+        data['Status'] = status
+        ctx.record(data)
+        ctx.consecutive_failures = 0
+        return
+
+    skipped, guess = predicted_save(ctx, data, ctx.pane_text)
+    if skipped: return
+
+    # 4. OPEN MODAL (Double Tap Strategy + Waits)
+    with TRACER.span("stage.modal_open"):
+        wait_for(driver, lambda d: apply_btn.is_displayed() and apply_btn.is_enabled(), 1.0)
         
-        consecutive_failures = 0
+        modal_opened = False
+        for attempt in range(2):
+            if attempt == 0:
+                robust_click(driver, apply_btn)
+            else:
+                log_debug("Retrying Apply click...")
+                driver.execute_script("arguments[0].click();", apply_btn)
+            
+            # Wait for modal to be visible AND done animating
+            modal = wait_for(driver, modal_settled(), MODAL_TIMEOUT)
+            if modal:
+                modal_opened = True
+                break
+    
+    if not modal_opened:
+        ctx.consecutive_failures += 1
+        force_clear_overlays(driver)
+        ctx.transient_failure(job, data, 'Modal failed to load')
+        if ctx.consecutive_failures >= 3:
+            print("[WARN] 3 consecutive modal failures. Refreshing page...")
+            ctx.consecutive_failures = 0
+            return RELOAD_PAGE
+        return
+
+    ctx.consecutive_failures = 0 # Success
+    capture_snapshot(driver, ctx, data['Job ID'])
+    
+    barriers = check_modal_requirements(driver, modal)
+    learn_modal(ctx, data, barriers, ctx.pane_text, guess)
+    if barriers:
+        req_str = ", ".join(barriers)
+        print(f"    [SAVE] Complex: {req_str}")
+        data['Status'] = 'Saved'
+        data['Requirements'] = req_str
+        ctx.record(data)
+        force_clear_overlays(driver)
+    else:
+        handle_resume_selection(driver, modal)
         
-        while True:
+        try:
+            submit = driver.find_element(By.XPATH, "//button[contains(text(), 'Submit') or contains(text(), 'Send')]")
+            
+            if not submit.is_enabled():
+                print("    [FAIL] Submit Disabled")
+                data['Status'] = 'Failed'
+                data['Requirements'] = 'Validation Error (Disabled)'
+                ctx.record(data)
+                force_clear_overlays(driver)
+                return
+
+            with TRACER.span("stage.submit"):
+                watching = arm_success_watch(driver)
+                robust_click(driver, submit)
+                # Returns as soon as a success marker or error banner appears
+                outcome = await_apply_outcome(driver, SUBMIT_TIMEOUT) if watching else None
+            
             force_clear_overlays(driver)
             
+            if outcome is None and verify_application_success(driver):
+                outcome = 'success' # Marker only rendered once the modal closed
+            
+            record_outcome(ctx, job, data, outcome)
+
+        except NoSuchElementException:
+            force_clear_overlays(driver)
+            ctx.transient_failure(job, data, 'No Submit Button')
+
+# --- PIPELINE ---
+
+# Clicks the results 'next page' button (chevron fallback). False if there is none.
+CLICK_NEXT_PAGE_JS = """
+let btn = document.querySelector("button[aria-label='next page']");
+if (!btn) {
+    let icon = document.querySelector("button svg[data-icon*='chevron-right']");
+    btn = icon ? icon.closest('button') : null;
+}
+if (!btn || btn.disabled) return false;
+btn.click();
+return true;
+"""
+
+class PagePrefetcher:
+    """
+    Producer half of the scan/apply pipeline: a second tab pages through the
+    search results and feeds unseen jobs into a bounded queue.
+    WebDriver runs one command at a time per session, so the producer is stepped
+    cooperatively (between jobs and while the consumer waits); the page loads
+    themselves proceed in the background tab while the main tab applies.
+    """
+    def __init__(self, driver, search_url, wants, feed=None, maxsize=PREFETCH_QUEUE_SIZE):
+        self.driver = driver
+        self.wants = wants
+        self.feed = feed
+        self.maxsize = maxsize
+        self.queue = deque()
+        self.queued = set()
+        self.done = False
+        self.pages = 0
+        self.page_marker = None # First Job ID of the last page scanned
+        self.requested_at = time.time()
+
+        # Metrics
+        self.depth_total = 0
+        self.depth_samples = 0
+        self.max_depth = 0
+        self.producer_stall = 0.0
+        self.consumer_stall = 0.0
+        self.stall_started = None
+
+        self.main_handle = driver.current_window_handle
+        driver.switch_to.new_window('tab')
+        self.handle = driver.current_window_handle
+        apply_resource_blocking(driver)
+        driver.get(search_url)
+        driver.switch_to.window(self.main_handle)
+
+    def step(self):
+        """
+        Advances the background tab by at most one page. Never blocks.
+        """
+        if self.done: return
+        if len(self.queue) >= self.maxsize:
+            if self.stall_started is None: self.stall_started = time.time()
+            return
+        if self.stall_started is not None:
+            self.producer_stall += time.time() - self.stall_started
+            self.stall_started = None
+
+        driver = self.driver
+        driver.switch_to.window(self.handle)
+        try:
+            cards = scan_cards(driver)
+            marker = cards[0]['id'] if cards else None
+            if marker is None or marker == self.page_marker:
+                # Next page still loading
+                if time.time() - self.requested_at > PREFETCH_PAGE_TIMEOUT:
+                    print("[PIPE] Results stopped changing. Producer finished.")
+                    self.done = True
+                return
+
+            self.page_marker = marker
+            self.pages += 1
+            if self.feed:
+                self.feed.harvest(driver)
+                cards = [self.feed.enrich(c) for c in cards]
+            new = 0
+            for card in cards:
+                if self.wants(card) and card['id'] not in self.queued:
+                    self.queue.append(card)
+                    self.queued.add(card['id'])
+                    new += 1
+            log_debug(f"Prefetched page {self.pages}: {new} new jobs (queue {len(self.queue)}).")
+
+            if driver.execute_script(CLICK_NEXT_PAGE_JS):
+                self.requested_at = time.time()
+            else:
+                self.done = True
+        finally:
+            driver.switch_to.window(self.main_handle)
+
+    def next_job(self):
+        """
+        Pops the next queued job, stepping the producer while the queue is empty.
+        Returns None once every page has been scanned and drained.
+        """
+        waited_from = None
+        while not self.queue and not self.done:
+            if waited_from is None: waited_from = time.time()
+            self.step()
+            if not self.queue: time.sleep(WAIT_POLL)
+        if waited_from is not None:
+            self.consumer_stall += time.time() - waited_from
+
+        if not self.queue: return None
+        self.depth_total += len(self.queue)
+        self.depth_samples += 1
+        self.max_depth = max(self.max_depth, len(self.queue))
+        return self.queue.popleft()
+
+    def metrics(self):
+        return {
+            'pages': self.pages,
+            'queue_depth': len(self.queue),
+            'avg_queue_depth': self.depth_total / self.depth_samples if self.depth_samples else 0.0,
+            'max_queue_depth': self.max_depth,
+            'producer_stall_s': self.producer_stall,
+            'consumer_stall_s': self.consumer_stall,
+        }
+
+    def summary(self):
+        m = self.metrics()
+        return (f"[PIPE] Pages: {m['pages']} | Queue depth avg {m['avg_queue_depth']:.1f}, "
+                f"max {m['max_queue_depth']} | Producer stall {m['producer_stall_s']:.1f}s | "
+                f"Consumer stall {m['consumer_stall_s']:.1f}s")
+
+def run_pipeline(driver, ctx):
+    """
+    Applies from the main tab while a PagePrefetcher pages ahead in a second tab.
+    """
+    prefetcher = PagePrefetcher(driver, driver.current_url, ctx.wants, ctx.feed)
+    processed = 0
+    try:
+        while True:
+            job = prefetcher.next_job()
+            if job is None:
+                print("[DONE] End.")
+                break
+            if not ctx.wants(job) or not ctx.claim(job): continue
+            if not ctx.limiter.can_apply():
+                with WATCHDOG.idle(): sleep_until_slot(ctx.limiter)
+
+            try:
+                with ctx.timed_job(job):
+                    result = process_job(driver, job, ctx)
+                if result == RELOAD_PAGE:
+                    driver.refresh()
+            except Exception as e:
+                if is_session_dead(e):
+                    raise SessionLost(str(e)[:50]) from e
+                print(f"[ERR] Processing Error: {str(e)[:50]}")
+                force_clear_overlays(driver)
+
+            processed += 1
+            if processed % LOG_FLUSH_ROWS == 0: ctx.log.checkpoint()
+            prefetcher.step() # Let the background tab advance between jobs
+    finally:
+        print(prefetcher.summary())
+
+# --- TAB SCHEDULER ---
+
+class JobTab:
+    """
+    One job in its own tab, advanced one non-blocking step at a time:
+    open -> load -> inspect -> modal -> apply -> ready -> verify -> done.
+    Output is buffered so interleaved jobs still print as one block each.
+    """
+    def __init__(self, job, ctx):
+        self.job = job
+        self.ctx = ctx
+        self.data = get_card_data(job)
+        self.data['Date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.state = 'open'
+        self.handle = None
+        self.deadline = None
+        self.attempts = 0
+        self.apply_btn = None
+        self.modal = None
+        self.submit = None
+        self.watching = False
+        self.modal_check = modal_settled()
+        self.pane_text = ""
+        self.guess = None
+        self.started = time.perf_counter()
+        self.lines = [f" -> {self.data['Company']} | {self.data['Title']}"]
+
+    def say(self, line):
+        self.lines.append(line)
+
+    def finish(self, status=None, requirements=None):
+        if status:
+            self.data['Status'] = status
+            if requirements is not None: self.data['Requirements'] = requirements
+            self.ctx.record(self.data)
+        self.state = 'done'
+
+    def step(self, driver):
+        """
+        One poll or action in the current state. Returns True if it made progress.
+        """
+        return getattr(self, '_' + self.state)(driver)
+
+    def _open(self, driver):
+        reason = filter_reason(self.data)
+        if reason:
+            self.say(f"    [SKIP] Filtered ({reason})")
+            self.finish('Filtered', reason)
+            return True
+        driver.switch_to.new_window('tab')
+        self.handle = driver.current_window_handle
+        apply_resource_blocking(driver)
+        driver.execute_script("location.href = arguments[0];", self.job['url']) # Returns before the load
+        self.state, self.deadline = 'load', time.time() + PAGE_TIMEOUT
+        return True
+
+    def _load(self, driver):
+        if pane_shows_job(self.job['id'])(driver):
+            self.state = 'inspect'
+            return True
+        if time.time() > self.deadline:
+            self.ctx.transient_failure(self.job, self.data, 'Job did not open', self.say)
+            self.state = 'done'
+        return False
+
+    def _inspect(self, driver):
+        pane = driver.find_element(By.CSS_SELECTOR, "div[data-hook='right-content']")
+        pane_text = self.pane_text = pane.text
+        if not self.data.get('Pay') and "$" in pane_text:
+            self.data['Pay'] = next(line for line in pane_text.split('\n') if "$" in line)
+        capture_snapshot(driver, self.ctx, self.data['Job ID'])
+        status, note, self.apply_btn = pane_verdict(pane, pane_text)
+        if status:
+            self.say(f"    {note}")
+            self.finish(status)
+            return True
+        skipped, self.guess = predicted_save(self.ctx, self.data, pane_text, say=self.say)
+        if skipped:
+            self.state = 'done'
+            return True
+        driver.execute_script("arguments[0].click();", self.apply_btn)
+        self.state, self.deadline, self.attempts = 'modal', time.time() + MODAL_TIMEOUT, 1
+        return True
+
+    def _modal(self, driver):
+        try: self.modal = self.modal_check(driver)
+        except (NoSuchElementException, StaleElementReferenceException): self.modal = None
+        if self.modal:
+            self.state = 'apply'
+            return True
+        if time.time() > self.deadline:
+            if self.attempts >= 2:
+                self.ctx.transient_failure(self.job, self.data, 'Modal failed to load', self.say)
+                self.state = 'done'
+                return True
+            driver.execute_script("arguments[0].click();", self.apply_btn)
+            self.deadline, self.attempts = time.time() + MODAL_TIMEOUT, self.attempts + 1
+        return False
+
+    def _apply(self, driver):
+        capture_snapshot(driver, self.ctx, self.data['Job ID'])
+        barriers = check_modal_requirements(driver, self.modal)
+        learn_modal(self.ctx, self.data, barriers, self.pane_text, self.guess)
+        if barriers:
+            req_str = ", ".join(barriers)
+            self.say(f"    [SAVE] Complex: {req_str}")
+            self.finish('Saved', req_str)
+            return True
+        handle_resume_selection(driver, self.modal)
+        try:
+            self.submit = driver.find_element(By.XPATH, "//button[contains(text(), 'Submit') or contains(text(), 'Send')]")
+        except NoSuchElementException:
+            self.ctx.transient_failure(self.job, self.data, 'No Submit Button', self.say)
+            self.state = 'done'
+            return True
+        if not self.submit.is_enabled():
+            self.say("    [FAIL] Submit Disabled")
+            self.finish('Failed', 'Validation Error (Disabled)')
+            return True
+        self.state = 'ready' # Submitted once the scheduler has quota for it
+        return True
+
+    def _ready(self, driver):
+        self.watching = arm_success_watch(driver)
+        driver.execute_script("arguments[0].click();", self.submit)
+        self.state, self.deadline = 'verify', time.time() + SUBMIT_TIMEOUT
+        return True
+
+    def _verify(self, driver):
+        outcome = driver.execute_script("return window.__hsApplyResult || null;") if self.watching else None
+        if not outcome and time.time() <= self.deadline: return False
+        if outcome is None:
             try:
-                wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div[data-hook^='job-result-card']")))
-                cards = driver.find_elements(By.CSS_SELECTOR, "div[data-hook^='job-result-card']")
-            except TimeoutException:
-                print("[INFO] No cards found. Retrying...")
-                time.sleep(2)
+                if application_confirmed(driver): outcome = 'success'
+            except NoSuchElementException: pass
+        record_outcome(self.ctx, self.job, self.data, outcome, say=self.say)
+        self.state = 'done'
+        return True
+
+class TabScheduler:
+    """
+    Interleaves up to `concurrency` JobTabs in one browser. Every round switches
+    to each live tab and advances it one step, so one tab's page load, modal
+    animation or submit round trip overlaps with work in the others.
+    A tab only submits while the quota has room for it on top of the
+    submissions still being verified, so DAILY_LIMIT holds.
+    """
+    def __init__(self, driver, ctx, concurrency=TAB_CONCURRENCY):
+        self.driver = driver
+        self.ctx = ctx
+        self.concurrency = concurrency
+        self.home = driver.current_window_handle
+        self.tabs = []
+
+    def in_flight(self):
+        return sum(1 for tab in self.tabs if tab.state == 'verify')
+
+    def may_submit(self):
+        return self.in_flight() < self.ctx.limiter.headroom()
+
+    def start_tabs(self):
+        ctx = self.ctx
+        started = {id(tab.job) for tab in self.tabs}
+        for job in list(ctx.pending):
+            if len(self.tabs) >= self.concurrency: return
+            if id(job) in started: continue
+            if not ctx.wants(job) or not ctx.claim(job):
+                ctx.pending.remove(job)
                 continue
-            except WebDriverException:
-                print("[CRITICAL] Browser disconnected. Exiting.")
-                break
+            if ctx.limiter.headroom() <= self.in_flight(): return # Quota full: drain first
+            self.tabs.append(JobTab(job, ctx))
 
-            jobs_to_process = [] 
-            print(f"\n[SCAN] Scanning {len(cards)} cards...")
-            for i, card in enumerate(cards):
-                try:
-                    hook = card.get_attribute("data-hook")
-                    if hook and "|" in hook:
-                        job_id = hook.split("|")[1].strip()
-                        if job_id not in history:
-                            jobs_to_process.append(i)
-                except StaleElementReferenceException: continue
-
-            print(f"[PLAN] Processing {len(jobs_to_process)} new jobs.")
-
-            if not jobs_to_process:
-                print("[NAV] Page finished. Attempting to click Next...")
-                try:
-                    next_btn = driver.find_element(By.CSS_SELECTOR, "button[aria-label='next page']")
-                    if not next_btn.is_enabled():
-                        print("[DONE] End.")
-                        break
-                    
-                    if not robust_click(driver, next_btn):
-                        driver.execute_script("arguments[0].click();", next_btn)
-                    
-                    time.sleep(5) 
+    def close(self, tab):
+        driver, ctx = self.driver, self.ctx
+        if tab.handle:
+            try:
+                driver.switch_to.window(tab.handle)
+                driver.close()
+            except WebDriverException: pass
+        self.tabs.remove(tab)
+        if tab.job in ctx.pending: ctx.pending.remove(tab.job)
+        ctx.job_durations.append(time.perf_counter() - tab.started)
+        print("\n".join(tab.lines))
+
+    def run(self):
+        """
+        Works through ctx.pending; jobs leave it once their tab is done, so a
+        browser relaunch restarts whatever was still in flight.
+        """
+        driver, ctx = self.driver, self.ctx
+        try:
+            while True:
+                self.start_tabs()
+                if not self.tabs:
+                    if not ctx.pending: return
+                    with WATCHDOG.idle(): sleep_until_slot(ctx.limiter)
                     continue
-                except (NoSuchElementException, WebDriverException) as e:
-                    if "invalid session" in str(e).lower():
-                        print("[CRITICAL] Browser Session Died. Stopping.")
-                        break
-                    
+
+                progressed = False
+                for tab in list(self.tabs):
+                    if tab.state == 'ready' and not self.may_submit(): continue
                     try:
-                        next_btn = driver.find_element(By.XPATH, "//button[.//svg[contains(@data-icon, 'chevron-right')]]")
-                        driver.execute_script("arguments[0].click();", next_btn)
-                        time.sleep(5)
-                        continue
-                    except:
-                        print("[DONE] No Next button found.")
-                        break
-
-            # --- PROCESS LOOP ---
-            page_needs_reload = False
-            
-            for index in jobs_to_process:
-                if applied_24h >= DAILY_LIMIT: return
+                        if tab.handle: driver.switch_to.window(tab.handle)
+                        progressed = tab.step(driver) or progressed
+                    except Exception as e:
+                        if is_session_dead(e):
+                            raise SessionLost(str(e)[:50]) from e
+                        tab.say(f"    [ERR] Processing Error: {str(e)[:50]}")
+                        tab.state = 'done'
+                    if tab.state == 'done':
+                        self.close(tab)
 
-                try:
-                    try: _ = driver.current_url
-                    except Exception: return
+                if progressed:
+                    WATCHDOG.beat()
+                elif all(tab.state == 'ready' for tab in self.tabs) and not self.may_submit():
+                    # Every tab is ready to submit but the quota is full
+                    with WATCHDOG.idle(): sleep_until_slot(ctx.limiter)
+                else:
+                    time.sleep(WAIT_POLL)
+        finally:
+            for tab in list(self.tabs):
+                if tab.handle:
+                    try:
+                        driver.switch_to.window(tab.handle)
+                        driver.close()
+                    except WebDriverException: pass
+            self.tabs = []
+            try: driver.switch_to.window(self.home)
+            except WebDriverException: pass
 
-                    current_cards = driver.find_elements(By.CSS_SELECTOR, "div[data-hook^='job-result-card']")
-                    if index >= len(current_cards): break
-                    card = current_cards[index]
-                    
-                    data = get_card_data(card)
-                    data['Date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    print(f" -> {data['Company']} | {data['Title']}")
+# --- PLANNER ---
 
-                    # 1. CLICK CARD
-                    if not robust_click(driver, card):
-                        log_debug("Card click failed, skipping.")
-                        continue
-                    
-                    time.sleep(1.0) # Wait for pane content to start loading
-                    
-                    # 2. FOCUS PANE (Fix for dead clicks)
-                    try:
-                        pane = driver.find_element(By.CSS_SELECTOR, "div[data-hook='right-content']")
-                        robust_click(driver, pane) # Focus click
-                        time.sleep(0.5) 
-                    except: 
-                        log_debug("Could not focus pane.")
-                        pass
-
-                    # 3. GET INFO
-                    try:
-                        pane = driver.find_element(By.CSS_SELECTOR, "div[data-hook='right-content']")
-                        pane_text = pane.text
-                        if "$" in pane_text:
-                            for line in pane_text.split('\n'):
-                                if "$" in line: data['Pay'] = line; break
-                    except: pane_text = ""
-
-                    if "Applied" in pane_text or "See application" in pane_text:
-                        print(f"    [SKIP] Already Applied")
-                        data['Status'] = 'Skipped'
-                        log_to_csv(csv_path, data)
-                        history.add(data['Job ID'])
-                        consecutive_failures = 0
-                        continue
+def score_job(card, predictor=None):
+    """
+    Priority of a scanned job, higher first: pay, remote / preferred location,
+    job type, posting recency, title keywords, minus predicted barrier risk.
+    """
+    data = get_card_data(card)
+    weights = SCORE_WEIGHTS
+    score = 0.0
+    pay = parse_pay(data['Pay'])
+    if pay: score += weights['pay_per_10_hr'] * (pay[0] + pay[1]) / 20
+    location = data['Location'].lower()
+    if "remote" in location: score += weights['remote']
+    if any(p.lower() in location for p in PREFERRED_LOCATIONS): score += weights['preferred_location']
+    score += JOB_TYPE_SCORES.get(data['Job Type'], 0.0)
+    age = days_since(card['posted']) if card.get('posted') else None
+    if age is not None: score += weights['fresh'] * max(0.0, 1 - age / RECENCY_DAYS)
+    title = data['Title'].lower()
+    score += sum(points for keyword, points in TITLE_KEYWORD_SCORES.items() if keyword.lower() in title)
+    if predictor:
+        p, _ = predictor.probability(predictor.features(data['Company'], data['Title']))
+        if p is not None: score -= weights['barrier_risk'] * p
+    return score
 
-                    try:
-                        apply_btn = pane.find_element(By.XPATH, ".//button[contains(., 'Apply')]")
-                    except NoSuchElementException:
-                        status = 'External' if "Apply externally" in pane_text else 'No Button'
-                        print(f"    [SKIP] {status}")
-                        data['Status'] = status
-                        log_to_csv(csv_path, data)
-                        history.add(data['Job ID'])
-                        consecutive_failures = 0
-                        continue
-
-                    if "external" in apply_btn.text.lower():
-                        print(f"    [SAVE] External Link")
-                        data['Status'] = 'External'
-                        log_to_csv(csv_path, data)
-                        history.add(data['Job ID'])
-                        consecutive_failures = 0
-                        continue
-
-                    # 4. OPEN MODAL (Double Tap Strategy + Delays)
-                    time.sleep(0.5) # Pre-click delay
-                    
-                    modal_opened = False
-                    for attempt in range(2):
-                        if attempt == 0:
-                            robust_click(driver, apply_btn)
-                        else:
-                            log_debug("Retrying Apply click...")
-                            driver.execute_script("arguments[0].click();", apply_btn)
-                        
-                        try:
-                            modal = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, "div[data-hook='apply-modal-content']")))
-                            modal_opened = True
-                            time.sleep(1.0) # Wait for modal animation to settle
-                            break
-                        except TimeoutException:
-                            pass
-                    
-                    if not modal_opened:
-                        print("    [ERR] Modal failed to load")
-                        consecutive_failures += 1
-                        force_clear_overlays(driver)
-                        if consecutive_failures >= 3:
-                            print("[WARN] 3 consecutive modal failures. Refreshing page...")
-                            page_needs_reload = True
-                            consecutive_failures = 0
-                            break
-                        continue
-
-                    consecutive_failures = 0 # Success
-                    
-                    barriers = check_modal_requirements(modal)
-                    if barriers:
-                        req_str = ", ".join(barriers)
-                        print(f"    [SAVE] Complex: {req_str}")
-                        data['Status'] = 'Saved'
-                        data['Requirements'] = req_str
-                        log_to_csv(csv_path, data)
-                        history.add(data['Job ID'])
-                        force_clear_overlays(driver)
-                    else:
-                        handle_resume_selection(driver, modal)
-                        
-                        try:
-                            submit = driver.find_element(By.XPATH, "//button[contains(text(), 'Submit') or contains(text(), 'Send')]")
-                            
-                            if not submit.is_enabled():
-                                print("    [FAIL] Submit Disabled")
-                                data['Status'] = 'Failed'
-                                data['Requirements'] = 'Validation Error (Disabled)'
-                                log_to_csv(csv_path, data)
-                                history.add(data['Job ID'])
-                                force_clear_overlays(driver)
-                                continue
-
-                            robust_click(driver, submit)
-                            time.sleep(2.0) # Wait for network request
-                            
-                            force_clear_overlays(driver)
-                            
-                            if verify_application_success(driver):
-                                print(f"    [SUCCESS] Application Verified!")
-                                data['Status'] = 'APPLIED'
-                                data['Requirements'] = 'Resume Only'
-                                applied_24h += 1
-                            else:
-                                print(f"    [FAIL] Validation Error (Not Verified)")
-                                data['Status'] = 'Failed'
-                                data['Requirements'] = 'Validation Error'
-                            
-                            log_to_csv(csv_path, data)
-                            history.add(data['Job ID'])
-
-                        except NoSuchElementException:
-                            print("    [FAIL] No Submit Button")
-                            force_clear_overlays(driver)
-
-                except Exception as e:
-                    err_msg = str(e).lower()
-                    if "invalid session" in err_msg or "disconnected" in err_msg:
-                        print("[CRITICAL] Browser Session Died. Exiting.")
-                        return
-                    
-                    print(f"[ERR] Processing Error: {str(e)[:50]}")
-                    force_clear_overlays(driver)
-                    continue
-            
-            if page_needs_reload:
-                driver.refresh()
-                time.sleep(5)
+class JobPlanner:
+    """
+    Priority queue (heapq) of candidate jobs gathered across result pages.
+    Excluded jobs are logged as 'Filtered' on the way in, before any click.
+    """
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.heap = []
+        self.queued = set()
+        self.filtered = 0
+
+    def add(self, cards):
+        ctx = self.ctx
+        for card in cards:
+            if not ctx.wants(card) or card['id'] in self.queued: continue
+            data = get_card_data(card)
+            reason = filter_reason(data)
+            if reason:
+                data['Date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                data['Status'] = 'Filtered'
+                data['Requirements'] = reason
+                ctx.record(data)
+                self.filtered += 1
                 continue
+            self.queued.add(card['id'])
+            # len(queued) breaks ties in scan order
+            heapq.heappush(self.heap, (-score_job(card, ctx.predictor), len(self.queued), card))
+
+    def drain(self):
+        jobs = []
+        while self.heap:
+            jobs.append(heapq.heappop(self.heap)[2])
+        return jobs
+
+def plan_ahead(driver, ctx, cursor, cards, page, pages=PLAN_AHEAD_PAGES):
+    """
+    Scans up to `pages` more result pages after the current one and returns
+    (every wanted job from all of them, best score first; last page reached).
+    """
+    planner = JobPlanner(ctx)
+    planner.add(cards)
+    first = page
+    for _ in range(pages):
+        marker = cards[0]['id'] if cards else None
+        if not next_results_page(driver, marker): break
+        page = page_of(driver.current_url) or page + 1
+        cursor.at(driver.current_url, page)
+        cards = scan_cards(driver)
+        if ctx.feed:
+            ctx.feed.harvest(driver)
+            cards = [ctx.feed.enrich(c) for c in cards]
+        planner.add(cards)
+    jobs = planner.drain()
+    if jobs or planner.filtered:
+        best = f", top score {score_job(jobs[0], ctx.predictor):.1f}" if jobs else ""
+        print(f"[PLAN] Pages {first}-{page}: {len(jobs)} candidates, {planner.filtered} filtered{best}.")
+    return jobs, page
+
+# --- SEARCH CURSOR ---
+
+def search_base(url):
+    """
+    The search URL with its filters, minus the page number and any open job.
+    """
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != 'page']
+    path = re.sub(r"/job-search/[^/]+$", "/job-search", parts.path)
+    return urlunsplit((parts.scheme, parts.netloc, path, urlencode(query), ''))
+
+def page_of(url):
+    for key, value in parse_qsl(urlsplit(url).query):
+        if key == 'page' and value.isdigit(): return int(value)
+    return None
+
+def page_url(url, page):
+    base = search_base(url)
+    if page <= 1: return base
+    return f"{base}{'&' if urlsplit(base).query else '?'}page={page}"
+
+class SearchCursor:
+    """
+    Remembers the filtered search and the last fully processed page, so the
+    next run opens the first unfinished page by URL instead of clicking
+    through pages that are already in history.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.search = None
+        self.page = 1
+        self.last_done = 0
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            self.search = saved.get('search')
+            self.page = saved.get('page', 1)
+            self.last_done = saved.get('last_done', 0)
+        except (OSError, ValueError): pass
+
+    def resume_url(self, start_url):
+        """
+        The saved search at its first unfinished page, unless start_url
+        explicitly asks for a different search.
+        """
+        if not self.search: return start_url
+        if start_url != SEARCH_URL and search_base(start_url) != self.search: return start_url
+        return page_url(self.search, self.last_done + 1)
+
+    def at(self, url, page):
+        # A different search (user changed filters) starts over
+        search = search_base(url)
+        if (search, page) == (self.search, self.page): return
+        if search != self.search:
+            self.search, self.last_done = search, 0
+        self.page = page
+        self.save()
+
+    def page_done(self, page):
+        if page == self.last_done: return
+        self.last_done = page
+        self.save()
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'search': self.search, 'page': self.page, 'last_done': self.last_done,
+                           'updated': datetime.now().strftime(DATE_FORMAT)}, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log_debug(f"Cursor not saved: {e}")
+
+def next_results_page(driver, marker):
+    """
+    Clicks Next and waits for the card set to change. False on the last page.
+    """
+    if not driver.execute_script(CLICK_NEXT_PAGE_JS): return False
+    if wait_for(driver, results_changed(marker), PAGE_TIMEOUT) is None:
+        print("[NAV] Next page did not render in time.")
+    return True
+
+# --- SUPERVISOR ---
+
+class SessionLost(Exception):
+    """The browser session died or hung; the supervisor relaunches it."""
+
+def process_tree(root_pid):
+    """
+    PIDs of root_pid and all its descendants (psutil if installed, else `ps`).
+    """
+    if psutil:
+        try:
+            root = psutil.Process(root_pid)
+            return [root_pid] + [p.pid for p in root.children(recursive=True)]
+        except psutil.Error:
+            return [root_pid]
+    try:
+        out = subprocess.run(["ps", "-A", "-o", "pid=,ppid="], capture_output=True, text=True, timeout=5).stdout
+    except (OSError, subprocess.SubprocessError):
+        return [root_pid]
+    children = defaultdict(list)
+    for line in out.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+            children[int(parts[1])].append(int(parts[0]))
+    pids, stack = [root_pid], [root_pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            pids.append(child)
+            stack.append(child)
+    return pids
+
+def browser_pids(driver):
+    """
+    chromedriver plus the Chrome processes it started (just chromedriver when
+    attached to a Chrome over DEBUG_PORT).
+    """
+    try: return process_tree(driver.service.process.pid)
+    except AttributeError: return []
+
+def kill_browser(driver):
+    for pid in reversed(browser_pids(driver)):
+        try: os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+        except OSError: pass
+
+class RecycleBrowser(Exception):
+    """Raised at a safe point between jobs to have the supervisor relaunch Chrome."""
+
+def process_rss_mb(pids):
+    """
+    Summed resident memory of pids in MB (shared pages are counted per process).
+    """
+    if not pids: return 0.0
+    if psutil:
+        total = 0
+        for pid in pids:
+            try: total += psutil.Process(pid).memory_info().rss
+            except psutil.Error: pass
+        return total / 2**20
+    try:
+        out = subprocess.run(["ps", "-o", "rss=", "-p", ",".join(map(str, pids))],
+                             capture_output=True, text=True, timeout=5).stdout
+    except (OSError, subprocess.SubprocessError):
+        return 0.0
+    return sum(int(kb) for kb in out.split() if kb.isdigit()) / 1024
+
+def js_heap_mb(driver):
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})['metrics']
+    except (WebDriverException, KeyError):
+        return 0.0
+    used = next((m['value'] for m in metrics if m['name'] == 'JSHeapUsedSize'), 0)
+    return used / 2**20
+
+class MemoryMonitor:
+    """
+    Samples the Chrome process tree's RSS and the tab's JS heap every few jobs
+    and says when to recycle the tab or browser (ceiling crossed, or too many
+    jobs since the last recycle).
+    """
+    def __init__(self):
+        self.jobs_since_recycle = 0
+        self.recycles = 0
+        self.peak_rss = 0.0
+        self.peak_heap = 0.0
+
+    def due(self, driver):
+        self.jobs_since_recycle += 1
+        if RECYCLE_AFTER_JOBS and self.jobs_since_recycle >= RECYCLE_AFTER_JOBS:
+            return f"{self.jobs_since_recycle} jobs since last recycle"
+        if self.jobs_since_recycle % MEMORY_CHECK_EVERY: return None
+
+        rss = process_rss_mb(browser_pids(driver))
+        heap = js_heap_mb(driver)
+        self.peak_rss = max(self.peak_rss, rss)
+        self.peak_heap = max(self.peak_heap, heap)
+        log_debug(f"Memory: Chrome RSS {rss:.0f} MB | JS heap {heap:.0f} MB")
+        if MEMORY_CEILING_MB and rss > MEMORY_CEILING_MB:
+            return f"Chrome RSS {rss:.0f} MB > {MEMORY_CEILING_MB} MB"
+        if JS_HEAP_CEILING_MB and heap > JS_HEAP_CEILING_MB:
+            return f"JS heap {heap:.0f} MB > {JS_HEAP_CEILING_MB} MB"
+        return None
+
+    def recycled(self):
+        self.jobs_since_recycle = 0
+        self.recycles += 1
+
+def recycle_tab(driver):
+    """
+    Reopens the current page in a fresh tab and closes the old one, releasing
+    the old renderer's memory. Cookies live in the profile, so the session stays.
+    """
+    url = driver.current_url
+    old = driver.current_window_handle
+    driver.switch_to.new_window('tab')
+    fresh = driver.current_window_handle
+    apply_resource_blocking(driver)
+    driver.switch_to.window(old)
+    driver.close()
+    driver.switch_to.window(fresh)
+    driver.get(url)
+    wait_for(driver, EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div[data-hook^='job-result-card']")), PAGE_TIMEOUT)
+
+def maybe_recycle(driver, ctx):
+    """
+    Safe point between jobs: recycles the tab, or raises RecycleBrowser for
+    the supervisor, when the memory monitor says so.
+    """
+    reason = ctx.memory.due(driver)
+    if not reason: return
+    ctx.memory.recycled()
+    print(f"[MEMORY] {reason}. Recycling the {RECYCLE_MODE}.")
+    if RECYCLE_MODE == "browser":
+        raise RecycleBrowser(reason)
+    recycle_tab(driver)
+    ctx.pane_text = ""
+
+class SessionWatchdog:
+    """
+    Background thread that kills a hung Chrome once the apply loop stops
+    heartbeating, so the blocked WebDriver call fails and the supervisor can
+    relaunch. Long legitimate waits (quota sleeps, user input) run inside idle().
+    """
+    def __init__(self, timeout=WATCHDOG_TIMEOUT):
+        self.timeout = timeout
+        self.driver = None
+        self.fired = False
+        self.suspended = False
+        self.last_beat = time.time()
+        self.thread = None
+
+    def watch(self, driver):
+        self.driver = driver
+        self.fired = False
+        self.beat()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="session-watchdog", daemon=True)
+            self.thread.start()
+
+    def unwatch(self):
+        self.driver = None
+
+    def beat(self):
+        self.last_beat = time.time()
+
+    @contextmanager
+    def idle(self):
+        self.suspended = True
+        try:
+            yield
+        finally:
+            self.suspended = False
+            self.beat()
+
+    def _run(self):
+        while True:
+            time.sleep(1)
+            driver = self.driver
+            if driver is None or self.suspended or not self.timeout: continue
+            if time.time() - self.last_beat > self.timeout:
+                print(f"\n[WATCHDOG] No progress for {self.timeout}s. Killing the browser.")
+                self.fired = True
+                self.driver = None
+                kill_browser(driver)
+
+WATCHDOG = SessionWatchdog()
+
+def run_due_retries(driver, ctx):
+    """
+    Retries queued transient failures whose backoff has passed. They open by
+    URL (their cards are usually on other pages), so the caller reloads the
+    results page afterwards. Returns True if any job was retried.
+    """
+    due = ctx.retries.due() if ctx.retries is not None else []
+    if not due: return False
+    print(f"[RETRY] Retrying {len(due)} jobs.")
+    for job in due:
+        if not ctx.claim(job): continue
+        if not ctx.limiter.can_apply():
+            with WATCHDOG.idle(): sleep_until_slot(ctx.limiter)
+        try:
+            with ctx.timed_job(job):
+                process_job(driver, job, ctx)
+        except Exception as e:
+            if is_session_dead(e):
+                raise SessionLost(str(e)[:50]) from e
+            print(f"[ERR] Retry Error: {str(e)[:50]}")
+            force_clear_overlays(driver)
+    ctx.log.checkpoint()
+    return True
+
+def browse(driver, ctx, cursor):
+    """
+    The page loop: scan, apply to new jobs, move on when a page is done.
+    Raises SessionLost when the browser dies; the pending queue and the cursor
+    survive in ctx / cursor for the relaunch.
+    """
+    wait = WebDriverWait(driver, 5)
+    page = page_of(driver.current_url) or 1
+    resumed = cursor.last_done > 0 and page > 1
+    while True:
+        WATCHDOG.beat()
+        force_clear_overlays(driver)
+        
+        try:
+            wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div[data-hook^='job-result-card']")))
+            cards = scan_cards(driver)
+            if ctx.feed:
+                ctx.feed.harvest(driver)
+                cards = [ctx.feed.enrich(c) for c in cards]
+        except TimeoutException:
+            if resumed:
+                # The saved page no longer exists (fewer results now)
+                print("[RESUME] Saved page is empty. Starting from page 1.")
+                resumed = False
+                driver.get(page_url(driver.current_url, 1))
+                page = 1
+                continue
+            print("[INFO] No cards found. Retrying...")
+            time.sleep(2)
+            continue
+        except WebDriverException as e:
+            raise SessionLost(f"Browser disconnected: {str(e)[:50]}") from e
+
+        page = page_of(driver.current_url) or page
+        cursor.at(driver.current_url, page)
+        print(f"\n[SCAN] Scanning {len(cards)} cards (page {page})...")
+        if ctx.pending:
+            # Relaunched mid-page: finish the jobs that were still queued
+            print(f"[RESUME] Restoring {len(ctx.pending)} pending jobs.")
+            jobs_to_process = [c for c in ctx.pending if ctx.wants(c)]
+        elif PLAN_AHEAD_PAGES:
+            jobs_to_process, page = plan_ahead(driver, ctx, cursor, cards, page)
+        else:
+            jobs_to_process = [c for c in cards if ctx.wants(c)]
+
+        print(f"[PLAN] Processing {len(jobs_to_process)} new jobs.")
+
+        if not jobs_to_process:
+            results_url = driver.current_url
+            if run_due_retries(driver, ctx):
+                driver.get(results_url)
+                continue
+            cursor.page_done(page)
+            print("[NAV] Page finished. Moving to next page...")
+            try:
+                marker = cards[0]['id'] if cards else None
+                if not next_results_page(driver, marker):
+                    print("[DONE] End.")
+                    return
+                page += 1
+                continue
+            except WebDriverException as e:
+                if is_session_dead(e):
+                    raise SessionLost(str(e)[:50]) from e
+                print(f"[DONE] No Next button found. ({str(e)[:50]})")
+                return
+
+        # --- PROCESS LOOP ---
+        page_needs_reload = False
+        
+        # Jobs leave the queue only once handled, so a crash retries the current one
+        ctx.pending = deque(jobs_to_process)
+        
+        if TAB_CONCURRENCY > 1:
+            TabScheduler(driver, ctx).run()
+        
+        while ctx.pending:
+            card_info = ctx.pending[0]
+            if ctx.crashes[card_info['id']] >= MAX_JOB_CRASHES:
+                print(f"[SKIP] {card_info['id']} crashed the browser {ctx.crashes[card_info['id']]} times.")
+                ctx.pending.popleft()
+                continue
+            if not ctx.claim(card_info):
+                ctx.pending.popleft()
+                continue
+            if not ctx.limiter.can_apply():
+                with WATCHDOG.idle(): sleep_until_slot(ctx.limiter)
+
+            try:
+                with ctx.timed_job(card_info):
+                    result = process_job(driver, card_info, ctx)
+                ctx.pending.popleft()
+                if result == RELOAD_PAGE:
+                    page_needs_reload = True
+                    break
+                maybe_recycle(driver, ctx)
+
+            except RecycleBrowser:
+                raise
+            except Exception as e:
+                if is_session_dead(e):
+                    raise SessionLost(str(e)[:50]) from e
+                ctx.pending.popleft()
+                
+                print(f"[ERR] Processing Error: {str(e)[:50]}")
+                force_clear_overlays(driver)
+                continue
+        
+        ctx.log.checkpoint()
+        
+        if page_needs_reload:
+            ctx.pending.clear() # Rescanned after the reload
+            driver.refresh()
+            time.sleep(5)
+            continue
+
+def run_session(ctx, cursor, profile_dir, headless, url, interactive):
+    """
+    Supervisor: runs the apply loop and, whenever the session dies or hangs,
+    tears Chrome down and relaunches it on the same profile at the cursor's
+    page with the pending jobs. Counts restarts and downtime in ctx; planned
+    RecycleBrowser relaunches are not counted.
+    """
+    lost_at = None
+    while True:
+        driver = launch_driver(profile_dir, headless)
+        count_webdriver_commands(driver, ctx.commands)
+        WATCHDOG.watch(driver)
+        try:
+            try:
+                driver.get(url)
+            except WebDriverException as e:
+                raise SessionLost(f"Navigation failed: {str(e)[:50]}") from e
+            if lost_at is not None:
+                ctx.downtime += time.time() - lost_at
+                lost_at = None
+            if interactive:
+                with WATCHDOG.idle():
+                    input("\n[PAUSE] Log in, Filter, and Press ENTER to start...")
+                interactive = False
+            
+            if PIPELINE_MODE:
+                run_pipeline(driver, ctx)
+            else:
+                browse(driver, ctx, cursor)
+            return
+        except RecycleBrowser:
+            # Planned relaunch at a safe point: quit cleanly, no crash accounting
+            WATCHDOG.unwatch()
+            try: driver.quit()
+            except WebDriverException: kill_browser(driver)
+            if cursor.search:
+                url = page_url(cursor.search, cursor.page)
+            continue
+        except Exception as e:
+            if not (isinstance(e, SessionLost) or is_session_dead(e)): raise
+            lost_at = lost_at or time.time()
+            if ctx.current_job:
+                ctx.crashes[ctx.current_job['id']] += 1
+                ctx.current_job = None
+            print(f"\n[CRITICAL] Browser session lost ({str(e)[:60]}).")
+        finally:
+            WATCHDOG.unwatch()
+
+        kill_browser(driver)
+        try: driver.quit()
+        except Exception: pass
+        if ctx.restarts >= MAX_RESTARTS:
+            print(f"[STOP] Browser relaunched {ctx.restarts} times already. Giving up.")
+            return
+        ctx.restarts += 1
+        if cursor.search:
+            url = page_url(cursor.search, cursor.page)
+        print(f"[RESTART] Relaunching Chrome ({ctx.restarts}/{MAX_RESTARTS}) at page {cursor.page}, "
+              f"{len(ctx.pending)} jobs pending...")
+        time.sleep(RESTART_DELAY)
+
+def run_bot(profile_dir=CHROME_PROFILE, worker=None, interactive=True, start_url=SEARCH_URL, headless=None):
+    """
+    Runs one bot session. Workers (see workerPool.py) pass their own profile,
+    a WorkerContext and interactive=False; benchmarkBot.py points start_url at
+    the offline fixture server. headless=None means: headless under FAST_LOAD
+    once the profile is logged in. Returns throughput stats.
+    """
+    if worker:
+        csv_path = os.path.join(DATA_DIR, f"application_log_{worker.name}.csv")
+        cursor = SearchCursor(os.path.join(DATA_DIR, f"search_cursor_{worker.name}.json"))
+    else:
+        csv_path = get_csv_filepath()
+        cursor = SearchCursor(CURSOR_FILE)
+    init_csv(csv_path)
+    store = open_history_store(csv_path, worker)
+    log = ApplicationLogWriter(csv_path)
+    
+    if worker:
+        limiter = SharedRateLimiter(store, DAILY_LIMIT, HOURLY_LIMIT)
+    else:
+        limiter = RateLimiter(DAILY_LIMIT, HOURLY_LIMIT, store.applied_times_since(datetime.now() - timedelta(hours=24)))
+    ctx = BotContext(store, log, limiter, worker)
+    ctx.retries = RetryQueue(os.path.join(DATA_DIR, f"retry_queue_{worker.name}.json") if worker else RETRY_FILE)
+    if ctx.retries:
+        print(f"[RETRY] {len(ctx.retries)} jobs waiting for another attempt.")
+    if PREDICT_BARRIERS:
+        ctx.predictor = BarrierPredictor.load(discover_csv_logs())
+    if SNAPSHOTS:
+        ctx.snapshots = snapshotStore.SnapshotStore(SNAPSHOT_DIR, SNAPSHOT_MAX_MB)
+    print(f"\n[LIMIT] Applications in last 24h: {limiter.used()} / {DAILY_LIMIT}")
+    
+    if not limiter.can_apply():
+        print("[LIMIT] Daily limit reached. Waiting for the window to roll over.")
+        try: sleep_until_slot(limiter)
+        except KeyboardInterrupt:
+            print("\n[STOP] User stopped bot.")
+            log.close()
+            store.close()
+            return ctx.stats()
+
+    if headless is None:
+        headless = FAST_LOAD and has_login_cookies(profile_dir)
+    if headless and interactive:
+        # Nobody can log in or filter in a headless window
+        print("[FAST] Logged-in profile found. Running headless from SEARCH_URL.")
+        interactive = False
+    
+    if TRACE_ENABLED:
+        suffix = f"_{worker.name}" if worker else ""
+        TRACER.start(os.path.join(TRACE_DIR, f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}.jsonl"), ctx.commands)
+
+    try:
+        resume_url = cursor.resume_url(start_url) if RESUME_SEARCH else start_url
+        if resume_url != start_url:
+            print(f"[RESUME] Page {cursor.last_done} already finished. Opening page {cursor.last_done + 1}.")
+        run_session(ctx, cursor, profile_dir, headless, resume_url, interactive)
 
     except KeyboardInterrupt:
         print("\n[STOP] User stopped bot.")
     finally:
+        TRACER.close()
+        if ctx.restarts:
+            print(f"[SUPERVISOR] Browser relaunched {ctx.restarts} times | downtime {ctx.downtime:.1f}s")
+        if ctx.predictor and ctx.predictor.session['predicted']:
+            print(ctx.predictor.summary())
+        if ctx.memory.recycles:
+            print(f"[MEMORY] Recycled {ctx.memory.recycles} times | peak Chrome RSS {ctx.memory.peak_rss:.0f} MB, "
+                  f"JS heap {ctx.memory.peak_heap:.0f} MB")
+        log.close()
+        store.close()
+        if ctx.predictor and not worker:
+            ctx.predictor.save(discover_csv_logs()) # Workers only read the model
         print(f"Data saved to: {csv_path}")
+    return ctx.stats()
 
 if __name__ == "__main__":
-    run_bot()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Handshake auto-apply bot")
+    parser.add_argument("--export-history", metavar="CSV",
+                        help="Write the SQLite history back out in the FIELDNAMES CSV layout and exit")
+    parser.add_argument("--barrier-report", action="store_true",
+                        help="Print the barrier predictor's expected hit rates on the newest logged jobs and exit")
+    parser.add_argument("--debug-port", type=int, default=DEBUG_PORT,
+                        help="Attach to the Chrome on this remote-debugging port, starting it if needed")
+    parser.add_argument("--headed", action="store_true",
+                        help="Always show the browser (e.g. to log in again or change filters)")
+    parser.add_argument("--snapshots", action="store_true", default=SNAPSHOTS,
+                        help=f"Record DOM snapshots of failed and sampled jobs to {SNAPSHOT_DIR}")
+    args = parser.parse_args()
+
+    if args.barrier_report:
+        report = evaluate_predictor(discover_csv_logs())
+        print(f"Trained on {report['train_rows']} rows, tested on {report['test_rows']} "
+              f"({report['barrier']} with barriers).")
+        print(f"Would skip {report['predicted']} modals: precision {report['precision']:.0%}, "
+              f"coverage {report['coverage']:.0%} of barrier jobs (threshold {BARRIER_THRESHOLD}).")
+    elif args.export_history:
+        store = SqliteHistoryStore(HISTORY_DB)
+        store.import_csv_logs(discover_csv_logs())
+        store.export_csv(args.export_history)
+        store.close()
+        print(f"History exported to: {args.export_history}")
+    else:
+        DEBUG_PORT = args.debug_port
+        SNAPSHOTS = args.snapshots
+        run_bot(headless=False if args.headed else None)
\ No newline at end of file
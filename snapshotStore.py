@@ -0,0 +1,122 @@
+import os
+import gzip
+import json
+import hashlib
+from datetime import datetime
+
+try:
+    import zstandard # Optional: smaller and faster than gzip
+except ImportError:
+    zstandard = None
+
+# --- CONFIGURATION ---
+INDEX_NAME = "index.jsonl"
+OBJECTS_DIR = "objects"
+ZSTD_LEVEL = 10
+GZIP_LEVEL = 6
+
+# --- STORE ---
+
+def content_hash(html):
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()[:32]
+
+class SnapshotStore:
+    """
+    Content-addressed DOM snapshots: each distinct HTML body is stored once,
+    zstd-compressed if zstandard is installed (gzip otherwise), under
+    objects/<hash[:2]>/<hash>.html.zst|.gz. index.jsonl records every capture
+    (time, Job ID, status, part, URL, hash), so an unchanged list or pane costs
+    one index line. With max_mb set, the oldest captures are dropped once the
+    objects outgrow it.
+    """
+    def __init__(self, root, max_mb=None):
+        self.root = root
+        self.max_mb = max_mb
+        self.index_path = os.path.join(root, INDEX_NAME)
+        self.stored_bytes = None # Computed on the first write that needs it
+
+    def _object_path(self, digest, ext):
+        return os.path.join(self.root, OBJECTS_DIR, digest[:2], f"{digest}.html{ext}")
+
+    def find(self, digest):
+        for ext in (".zst", ".gz"):
+            path = self._object_path(digest, ext)
+            if os.path.exists(path): return path
+        return None
+
+    def put(self, html, part, job_id="", status="", url=""):
+        """
+        Stores one captured HTML part ('list', 'pane', 'modal' or 'page') and
+        returns its hash.
+        """
+        digest = content_hash(html)
+        written = 0
+        if not self.find(digest):
+            raw = html.encode('utf-8')
+            if zstandard:
+                path, blob = self._object_path(digest, ".zst"), zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+            else:
+                path, blob = self._object_path(digest, ".gz"), gzip.compress(raw, GZIP_LEVEL, mtime=0)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, 'wb') as f:
+                f.write(blob)
+            os.replace(tmp, path)
+            written = len(blob)
+        entry = {'time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'job_id': job_id, 'status': status,
+                 'part': part, 'url': url, 'hash': digest, 'size': len(html), 'new': bool(written)}
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+        if written and self.max_mb:
+            if self.stored_bytes is None: self.stored_bytes = self.disk_usage()
+            else: self.stored_bytes += written
+            if self.stored_bytes > self.max_mb * 2**20: self.prune()
+        return digest
+
+    def get(self, digest):
+        path = self.find(digest)
+        if not path: return None
+        with open(path, 'rb') as f:
+            blob = f.read()
+        if path.endswith(".zst"):
+            if not zstandard: raise RuntimeError("zstandard is needed to read .zst snapshots")
+            return zstandard.ZstdDecompressor().decompress(blob).decode('utf-8')
+        return gzip.decompress(blob).decode('utf-8')
+
+    def entries(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try: yield json.loads(line)
+                    except ValueError: pass # Torn last line
+        except OSError:
+            return
+
+    def latest(self, job_id):
+        """The newest hash of each part captured for job_id."""
+        parts = {}
+        for entry in self.entries():
+            if entry['job_id'] == job_id: parts[entry['part']] = entry['hash']
+        return parts
+
+    def disk_usage(self):
+        total = 0
+        for folder, _, files in os.walk(os.path.join(self.root, OBJECTS_DIR)):
+            total += sum(os.path.getsize(os.path.join(folder, name)) for name in files)
+        return total
+
+    def prune(self):
+        """
+        Drops the oldest half of the index and every object only it referenced.
+        """
+        entries = list(self.entries())
+        keep = entries[len(entries) // 2:]
+        referenced = {e['hash'] for e in keep}
+        for digest in {e['hash'] for e in entries} - referenced:
+            path = self.find(digest)
+            if path: os.remove(path)
+        tmp = self.index_path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(e) + "\n" for e in keep)
+        os.replace(tmp, self.index_path)
+        self.stored_bytes = self.disk_usage()
@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import multiprocessing as mp
+
+import seleniumBot as bot
+
+# --- CONFIGURATION ---
+WORKER_PROFILES_DIR = os.path.join(bot.DATA_DIR, "worker_profiles")
+
+# Lock files and caches that must not be copied between Chrome instances
+PROFILE_IGNORE = shutil.ignore_patterns(
+    "Singleton*", "*.lock", "lockfile", "LOCK",
+    "Cache", "Code Cache", "GPUCache", "ShaderCache", "GrShaderCache", "Crashpad"
+)
+
+# --- PROFILES ---
+
+def clone_profile(index):
+    """
+    Copies the logged-in CHROME_PROFILE into a per-worker directory so every
+    worker gets its own Chrome instance with the same session cookies.
+    """
+    dest = os.path.join(WORKER_PROFILES_DIR, f"worker{index}")
+    if os.path.exists(dest):
+        shutil.rmtree(dest, ignore_errors=True)
+    shutil.copytree(bot.CHROME_PROFILE, dest, ignore=PROFILE_IGNORE)
+    return dest
+
+# --- WORKERS ---
+
+def worker_main(index, count, profile_dir, search_url, results):
+    worker = bot.WorkerContext(index, count)
+    stats = {'jobs': 0, 'applied': 0, 'elapsed_s': 0.0}
+    try:
+        stats = bot.run_bot(profile_dir=profile_dir, worker=worker, interactive=False, start_url=search_url) or stats
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"[{worker.name}] [CRITICAL] {e}")
+    finally:
+        results.put((index, stats))
+
+def report(results):
+    print("\n--- WORKER THROUGHPUT ---")
+    total_jobs = total_applied = 0
+    for index in sorted(results):
+        stats = results[index]
+        hours = max(stats['elapsed_s'], 1) / 3600
+        total_jobs += stats['jobs']
+        total_applied += stats['applied']
+        restarts = f", {stats['restarts']} browser relaunches" if stats.get('restarts') else ""
+        print(f"worker{index}: {stats['jobs']} jobs ({stats['jobs'] / hours:.1f}/h), "
+              f"{stats['applied']} applied ({stats['applied'] / hours:.1f}/h){restarts}")
+    print(f"TOTAL: {total_jobs} jobs, {total_applied} applied")
+
+def run_pool(num_workers, search_url):
+    if not os.path.exists(bot.CHROME_PROFILE):
+        print("[ERROR] No Chrome profile yet. Run seleniumBot.py once and log in first.")
+        return
+
+    # Bring the shared DB up to date once, before workers race to import
+    store = bot.SqliteHistoryStore(bot.HISTORY_DB)
+    store.import_csv_logs(bot.discover_csv_logs())
+    store.close()
+
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    procs = []
+    for index in range(num_workers):
+        profile = clone_profile(index)
+        proc = ctx.Process(target=worker_main, args=(index, num_workers, profile, search_url, queue), name=f"worker{index}")
+        proc.start()
+        procs.append(proc)
+        print(f"[POOL] Started worker{index} (pid {proc.pid})")
+        time.sleep(2) # Stagger Chrome launches
+
+    results = {}
+    try:
+        while len(results) < len(procs):
+            index, stats = queue.get()
+            results[index] = stats
+    except KeyboardInterrupt:
+        print("\n[STOP] Stopping workers...")
+        while len(results) < len(procs) and any(p.is_alive() for p in procs):
+            try:
+                index, stats = queue.get(timeout=30)
+                results[index] = stats
+            except Exception: break
+    finally:
+        for proc in procs:
+            proc.join(timeout=10)
+    report(results)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run several Handshake bot workers in parallel")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of Chrome workers")
+    parser.add_argument("--search-url", default=bot.SEARCH_URL, help="Job search URL (with filters) for every worker")
+    args = parser.parse_args()
+    if args.workers < 1: sys.exit("--workers must be at least 1")
+    run_pool(args.workers, args.search_url)